@@ -0,0 +1 @@
+"""Lets the tests under labs/03/tests import the ``regression`` package."""
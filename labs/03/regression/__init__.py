@@ -0,0 +1,166 @@
+"""Vectorized linear-regression tools for the labs/03 and students/03 data.
+
+Run scripts from ``labs/03`` so that ``import regression`` resolves, e.g.
+``python -m regression problems``.
+"""
+
+from .basis import BasisRegression, degree_scan, design_matrix, select_degree
+from .batch import fit_problems, simple_ols_batch
+from .bootstrap import bootstrap_ci, bootstrap_coefs, bootstrap_model
+from .closed_form import LeastSquaresFit, least_squares
+from .cv import cv_marketing, repeated_kfold, summarize_cv
+from .datasets import load_problems
+from .fleet import (
+    check_leaderboard,
+    data_catalog,
+    find_submissions,
+    read_leaderboard,
+    run_fleet,
+    run_submission,
+    write_leaderboard,
+)
+from .fused import (
+    Affine,
+    FusedLinearModel,
+    OneHotMap,
+    check_equivalence,
+    compile_pipeline,
+)
+from .grouped import grouped_ols, grouped_salaries
+from .inference import (
+    batch_inference,
+    format_summary,
+    model_inference,
+    ols_summary,
+    problems_inference,
+)
+from .influence import flag_influential, influence, influence_model
+from .intervals import model_intervals, prediction_bands, prediction_frame
+from .loocv import loocv_table, press, press_batch
+from .multi import MultiTargetFit, marketing_multi_target, multi_target_ols
+from .ols import OLSFit
+from .partial_dependence import PartialDependence, partial_dependence
+from .path import RegularizationPath, enet_path, lasso_path, path_model, ridge_path
+from .precision import precision_model, precision_report, precision_synthetic
+from .quantile import (
+    ConvergenceWarning,
+    QuantileFit,
+    quantile_model,
+    quantile_regression,
+)
+from .registry import ModelArtifact, ModelRegistry
+from .rls import RecursiveLeastSquares
+from .robust import irls_batch, ransac_batch, robust_model, robust_problems
+from .scoring import LinearScorer, marketing_scorer
+from .sparse import (
+    CategoricalEncoder,
+    fit_classifiers,
+    hashed_csr,
+    intrusion_design,
+    one_hot_csr,
+    salaries_design,
+    sparse_lsqr,
+    sparse_salaries,
+)
+from .streaming import (
+    GramAccumulator,
+    StreamingLinearRegression,
+    fit_marketing_streaming,
+)
+from .subsets import best_subsets, subsets_model
+from .synthetic import (
+    generate_marketing,
+    generate_problem,
+    marketing_chunk,
+    problem_chunk,
+)
+
+__all__ = [
+    "Affine",
+    "BasisRegression",
+    "CategoricalEncoder",
+    "ConvergenceWarning",
+    "FusedLinearModel",
+    "GramAccumulator",
+    "LeastSquaresFit",
+    "LinearScorer",
+    "ModelArtifact",
+    "ModelRegistry",
+    "MultiTargetFit",
+    "OLSFit",
+    "OneHotMap",
+    "PartialDependence",
+    "QuantileFit",
+    "RecursiveLeastSquares",
+    "RegularizationPath",
+    "StreamingLinearRegression",
+    "batch_inference",
+    "best_subsets",
+    "bootstrap_ci",
+    "bootstrap_coefs",
+    "bootstrap_model",
+    "check_equivalence",
+    "check_leaderboard",
+    "compile_pipeline",
+    "cv_marketing",
+    "data_catalog",
+    "degree_scan",
+    "design_matrix",
+    "enet_path",
+    "find_submissions",
+    "fit_classifiers",
+    "fit_marketing_streaming",
+    "fit_problems",
+    "flag_influential",
+    "format_summary",
+    "generate_marketing",
+    "generate_problem",
+    "grouped_ols",
+    "grouped_salaries",
+    "hashed_csr",
+    "influence",
+    "influence_model",
+    "intrusion_design",
+    "irls_batch",
+    "lasso_path",
+    "least_squares",
+    "load_problems",
+    "loocv_table",
+    "marketing_chunk",
+    "marketing_multi_target",
+    "marketing_scorer",
+    "model_inference",
+    "model_intervals",
+    "multi_target_ols",
+    "ols_summary",
+    "one_hot_csr",
+    "partial_dependence",
+    "path_model",
+    "precision_model",
+    "precision_report",
+    "precision_synthetic",
+    "prediction_bands",
+    "prediction_frame",
+    "press",
+    "press_batch",
+    "problem_chunk",
+    "problems_inference",
+    "quantile_model",
+    "quantile_regression",
+    "ransac_batch",
+    "read_leaderboard",
+    "repeated_kfold",
+    "ridge_path",
+    "robust_model",
+    "robust_problems",
+    "run_fleet",
+    "run_submission",
+    "salaries_design",
+    "select_degree",
+    "simple_ols_batch",
+    "sparse_lsqr",
+    "sparse_salaries",
+    "subsets_model",
+    "summarize_cv",
+    "write_leaderboard",
+]
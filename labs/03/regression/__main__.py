@@ -0,0 +1,414 @@
+"""Command line entry point: ``python -m regression <command>`` from labs/03."""
+
+import argparse
+
+import pandas as pd
+
+from .datasets import MARKETING_CSV, MODELS
+
+
+def _cmd_grouped(args):
+    from .grouped import grouped_salaries
+
+    print(grouped_salaries(args.by).to_string(index=False))
+
+
+def _cmd_influence(args):
+    from .influence import influence_model
+
+    table = influence_model(args.model)
+    flagged = table[table.influential].sort_values("cooks_d", ascending=False)
+    print(f"{len(flagged)} of {len(table)} rows flagged")
+    print(flagged.to_string())
+
+
+def _cmd_inference(args):
+    from .inference import format_summary, model_inference, problems_inference
+
+    if args.model:
+        print(format_summary(*model_inference(args.model)))
+        return
+    coef_table, model_table = problems_inference()
+    print(model_table.to_string(index=False))
+    if args.coefs:
+        print()
+        print(coef_table.to_string(index=False))
+
+
+def _cmd_intervals(args):
+    import time
+
+    import numpy as np
+
+    from .datasets import load_model_data
+    from .intervals import model_intervals, prediction_bands
+    from .ols import OLSFit
+
+    if args.predict:
+        table = model_intervals(args.model, [args.predict], alpha=args.alpha)
+        print(table.T.to_string(header=False))
+    if args.rows:
+        X, y, _ = load_model_data(args.model)
+        fit = OLSFit.fit(X, y)
+        rng = np.random.default_rng(0)
+        query = rng.uniform(X.min(axis=0), X.max(axis=0), (args.rows, X.shape[1]))
+        start = time.perf_counter()
+        prediction_bands(fit, query, alpha=args.alpha)
+        print(f"{args.rows} rows in {time.perf_counter() - start:.2f} s")
+
+
+def _cmd_loocv(args):
+    from .loocv import loocv_table
+
+    print(loocv_table(models=args.models).to_string(index=False))
+
+
+def _cmd_precision(args):
+    from .precision import precision_model, precision_synthetic
+
+    if args.rows:
+        table = precision_synthetic(args.rows, collinearity=args.collinearity)
+    else:
+        table = precision_model(args.model)
+    print(table.to_string(index=False))
+
+
+def _cmd_problems(args):
+    from .batch import fit_problems
+
+    table = fit_problems(args.data_dir) if args.data_dir else fit_problems()
+    print(table.to_string(index=False))
+
+
+def _cmd_degree(args):
+    from .basis import select_degree
+
+    table = select_degree(args.max_degree, args.criterion)
+    print(table.to_string(index=False))
+
+
+def _cmd_quantile(args):
+    from .quantile import quantile_model
+
+    table, fit = quantile_model(args.model, args.quantiles, args.method)
+    print(table.to_string(index=False))
+    if args.predict:
+        band = fit.predict([args.predict])[0]
+        for tau, value in zip(fit.quantiles, band):
+            print(f"q{tau:g}: {value:.4f}")
+
+
+def _cmd_robust(args):
+    from .robust import robust_model, robust_problems
+
+    if args.model:
+        print(robust_model(args.model, args.method).to_string())
+    else:
+        print(robust_problems(args.method).to_string(index=False))
+
+
+def _cmd_sparse(args):
+    from .sparse import sparse_salaries
+
+    table, fit = sparse_salaries(categorical=args.categorical)
+    print(table.to_string(index=False))
+    print(f"n = {fit.n}, R² = {fit.r2:.4f}")
+
+
+def _cmd_stream(args):
+    from .streaming import fit_marketing_streaming
+
+    model = fit_marketing_streaming(args.path, chunksize=args.chunksize)
+    print(f"n = {model.n_samples_}")
+    print(f"intercept = {model.intercept_:.6f}")
+    for name, coef in zip(model.feature_names, model.coef_):
+        print(f"{name} = {coef:.6f}")
+    print(f"R2 = {model.r2_:.4f}, RMSE = {model.rmse_:.4f}")
+
+
+def _cmd_cv(args):
+    from .cv import cv_marketing, summarize_cv
+
+    scores = cv_marketing(
+        n_splits=args.splits, n_repeats=args.repeats, seed=args.seed, n_jobs=args.jobs
+    )
+    print(f"{args.repeats} x {args.splits}-fold CV, {len(scores)} folds")
+    print(summarize_cv(scores))
+
+
+def _cmd_bootstrap(args):
+    from .bootstrap import bootstrap_model
+
+    print(f"{args.replicates} bootstrap replicates, {args.model} model")
+    print(bootstrap_model(args.model, n_boot=args.replicates, alpha=args.alpha))
+
+
+def _cmd_subsets(args):
+    from .subsets import subsets_model
+
+    table = subsets_model(args.model, top=args.top, rank_by=args.rank_by)
+    print(table.to_string(index=False))
+
+
+def _cmd_path(args):
+    from .path import path_model
+
+    path, features = path_model(args.model, args.kind, l1_ratio=args.l1_ratio)
+    table = pd.DataFrame(path.coefs, columns=features)
+    table.insert(0, "alpha", path.alphas)
+    table["intercept"] = path.intercepts
+    table["r2"] = path.r2
+    for name, values in path.extra.items():
+        table[name] = values
+    print(table.iloc[:: args.every].to_string(index=False))
+
+
+def _cmd_bench_closed_form(args):
+    from .benchmarks import bench_closed_form
+
+    sizes = [10**k for k in range(3, args.max_exp + 1)]
+    table = bench_closed_form(sizes, repeat=args.repeat)
+    print(table.pivot(index="n_rows", columns="method", values="seconds"))
+
+
+def _cmd_bench_scoring(args):
+    from .benchmarks import bench_scoring
+
+    print(bench_scoring(n_calls=args.calls, n_rows=args.rows).to_string(index=False))
+
+
+def _cmd_bench_fused(args):
+    from .benchmarks import bench_fused
+
+    print(bench_fused(n_rows=args.rows).to_string(index=False))
+
+
+def _cmd_fleet(args):
+    from .fleet import (
+        check_leaderboard,
+        read_leaderboard,
+        run_fleet,
+        write_leaderboard,
+    )
+
+    table = run_fleet(timeout=args.timeout, n_jobs=args.jobs)
+    columns = ["rank", "name", "status", "wall_s", "import_s", "peak_rss_mb", "r2"]
+    print(table[columns].to_string(index=False))
+    for path in write_leaderboard(table, args.out):
+        print(path)
+    if args.baseline:
+        problems = check_leaderboard(
+            table, read_leaderboard(args.baseline), max_slowdown=args.max_slowdown
+        )
+        if len(problems):
+            print(problems.to_string(index=False))
+            raise SystemExit(1)
+        print("gate passed")
+
+
+def _cmd_generate(args):
+    from .synthetic import generate_marketing, generate_problem
+
+    kwargs = dict(seed=args.seed, fmt=args.fmt)
+    if args.noise is not None:
+        kwargs["noise"] = args.noise
+    if args.schema == "marketing":
+        path = generate_marketing(
+            args.path, args.rows, collinearity=args.collinearity, **kwargs
+        )
+    else:
+        path = generate_problem(args.path, args.rows, **kwargs)
+    print(path)
+
+
+def _cmd_bench_scaling(args):
+    from .benchmarks import bench_scaling, crossover_points
+
+    sizes = [10**k for k in range(3, args.max_exp + 1)]
+    table = bench_scaling(
+        sizes,
+        repeat=args.repeat,
+        collinearity=args.collinearity,
+        in_memory_max=10**args.in_memory_exp,
+        data_dir=args.data_dir,
+    )
+    print(table.to_string(index=False))
+    print()
+    print(crossover_points(table).to_string(index=False))
+
+
+def _cmd_serve(args):
+    from .scoring import serve
+
+    serve(host=args.host, port=args.port)
+
+
+def _cmd_models(args):
+    from .registry import DEFAULT_ROOT, ModelRegistry
+
+    registry = ModelRegistry(args.root or DEFAULT_ROOT)
+    if args.save_marketing:
+        from .streaming import fit_marketing_streaming
+
+        version = registry.save("marketing", fit_marketing_streaming())
+        print(f"saved marketing v{version}")
+    if args.pin:
+        name, version = args.pin.split(":")
+        registry.pin(name, int(version))
+    print(registry.list().to_string(index=False))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m regression")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("problems", help="fit all students/03 problems at once")
+    p.add_argument("--data-dir", default=None)
+    p.set_defaults(func=_cmd_problems)
+
+    p = commands.add_parser("degree", help="polynomial degree for every problem")
+    p.add_argument("--max-degree", type=int, default=5)
+    p.add_argument("--criterion", choices=["aic", "bic", "cv"], default="aic")
+    p.set_defaults(func=_cmd_degree)
+
+    p = commands.add_parser("quantile", help="quantile regression over many levels")
+    p.add_argument("--model", choices=sorted(MODELS), default="marketing")
+    p.add_argument("--quantiles", type=float, nargs="+", default=[0.1, 0.5, 0.9])
+    p.add_argument("--method", choices=["ip", "irls"], default="ip")
+    p.add_argument(
+        "--predict", type=float, nargs="+", default=None, help="feature values"
+    )
+    p.set_defaults(func=_cmd_quantile)
+
+    p = commands.add_parser("robust", help="Huber / Tukey IRLS or RANSAC fits")
+    p.add_argument("--method", choices=["huber", "tukey", "ransac"], default="huber")
+    p.add_argument("--model", choices=sorted(MODELS), default=None)
+    p.set_defaults(func=_cmd_robust)
+
+    p = commands.add_parser("grouped", help="salary ~ phd + service per group")
+    p.add_argument("--by", nargs="+", default=["rank", "discipline", "sex"])
+    p.set_defaults(func=_cmd_grouped)
+
+    p = commands.add_parser("influence", help="leverage, Cook's D, DFFITS")
+    p.add_argument("--model", choices=sorted(MODELS), default="marketing")
+    p.set_defaults(func=_cmd_influence)
+
+    p = commands.add_parser("inference", help="SE, t, p, F and cond. no. tables")
+    p.add_argument("--model", choices=sorted(MODELS), default=None)
+    p.add_argument("--coefs", action="store_true", help="also print coefficients")
+    p.set_defaults(func=_cmd_inference)
+
+    p = commands.add_parser("intervals", help="confidence / prediction bands")
+    p.add_argument("--model", choices=sorted(MODELS), default="marketing")
+    p.add_argument("--predict", type=float, nargs="+", default=None)
+    p.add_argument("--rows", type=int, default=0, help="time N random query rows")
+    p.add_argument("--alpha", type=float, default=0.05)
+    p.set_defaults(func=_cmd_intervals)
+
+    p = commands.add_parser("loocv", help="exact leave-one-out RMSE per dataset")
+    p.add_argument("--models", nargs="*", choices=sorted(MODELS), default=["marketing"])
+    p.set_defaults(func=_cmd_loocv)
+
+    p = commands.add_parser("precision", help="float32 vs float64 OLS accuracy")
+    p.add_argument("--model", choices=sorted(MODELS), default="marketing")
+    p.add_argument("--rows", type=int, default=0, help="use N synthetic rows instead")
+    p.add_argument("--collinearity", type=float, default=0.0)
+    p.set_defaults(func=_cmd_precision)
+
+    p = commands.add_parser("sparse", help="salary OLS on a sparse one-hot design")
+    p.add_argument("--categorical", nargs="+", default=["rank", "discipline", "sex"])
+    p.set_defaults(func=_cmd_sparse)
+
+    p = commands.add_parser("stream", help="chunked OLS on a marketing-shaped CSV")
+    p.add_argument("path", nargs="?", default=str(MARKETING_CSV))
+    p.add_argument("--chunksize", type=int, default=1_000_000)
+    p.set_defaults(func=_cmd_stream)
+
+    p = commands.add_parser("cv", help="repeated K-fold CV of the Sales model")
+    p.add_argument("--splits", type=int, default=5)
+    p.add_argument("--repeats", type=int, default=1000)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--jobs", type=int, default=None)
+    p.set_defaults(func=_cmd_cv)
+
+    p = commands.add_parser("bootstrap", help="percentile and BCa coefficient CIs")
+    p.add_argument("--model", choices=sorted(MODELS), default="marketing")
+    p.add_argument("--replicates", type=int, default=100_000)
+    p.add_argument("--alpha", type=float, default=0.05)
+    p.set_defaults(func=_cmd_bootstrap)
+
+    p = commands.add_parser("subsets", help="rank all feature subsets")
+    p.add_argument("--model", choices=sorted(MODELS), default="marketing")
+    p.add_argument("--top", type=int, default=None)
+    p.add_argument("--rank-by", choices=["adj_r2", "aic", "bic"], default="bic")
+    p.set_defaults(func=_cmd_subsets)
+
+    p = commands.add_parser("path", help="ridge / lasso / elastic-net path")
+    p.add_argument("--model", choices=sorted(MODELS), default="marketing")
+    p.add_argument("--kind", choices=["ridge", "lasso", "enet"], default="ridge")
+    p.add_argument("--l1-ratio", type=float, default=0.5)
+    p.add_argument("--every", type=int, default=10, help="print every N-th alpha")
+    p.set_defaults(func=_cmd_path)
+
+    p = commands.add_parser(
+        "bench-closed-form", help="least_squares vs iterrows/polyfit/sklearn/OLS"
+    )
+    p.add_argument("--max-exp", type=int, default=8, help="largest size is 10**N")
+    p.add_argument("--repeat", type=int, default=3)
+    p.set_defaults(func=_cmd_bench_closed_form)
+
+    p = commands.add_parser("bench-scoring", help="scalar and bulk scoring speed")
+    p.add_argument("--calls", type=int, default=10_000)
+    p.add_argument("--rows", type=int, default=10**7)
+    p.set_defaults(func=_cmd_bench_scoring)
+
+    p = commands.add_parser("bench-fused", help="scaler + predict vs fused map")
+    p.add_argument("--rows", type=int, default=10**7)
+    p.set_defaults(func=_cmd_bench_fused)
+
+    p = commands.add_parser("fleet", help="run and rank every students/03 submission")
+    p.add_argument("--out", default="leaderboard", help="writes OUT.json and OUT.csv")
+    p.add_argument("--timeout", type=float, default=120.0)
+    p.add_argument("--jobs", type=int, default=None)
+    p.add_argument("--baseline", default=None, help="leaderboard to gate against")
+    p.add_argument("--max-slowdown", type=float, default=1.5)
+    p.set_defaults(func=_cmd_fleet)
+
+    p = commands.add_parser("generate", help="write a synthetic dataset to disk")
+    p.add_argument("path")
+    p.add_argument("--schema", choices=["marketing", "problem"], default="marketing")
+    p.add_argument("--rows", type=int, default=10**6)
+    p.add_argument("--noise", type=float, default=None)
+    p.add_argument("--collinearity", type=float, default=0.0)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--fmt", choices=["csv", "npy"], default="csv")
+    p.set_defaults(func=_cmd_generate)
+
+    p = commands.add_parser(
+        "bench-scaling", help="lstsq/normal/QR/chunked/sklearn fit vs. rows"
+    )
+    p.add_argument("--max-exp", type=int, default=8, help="largest size is 10**N")
+    p.add_argument("--in-memory-exp", type=int, default=7)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--collinearity", type=float, default=0.0)
+    p.add_argument("--data-dir", default=None, help="keep generated .npy files here")
+    p.set_defaults(func=_cmd_bench_scaling)
+
+    p = commands.add_parser("serve", help="HTTP scoring endpoint for the Sales model")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000)
+    p.set_defaults(func=_cmd_serve)
+
+    p = commands.add_parser("models", help="list, save or pin registry artifacts")
+    p.add_argument("--root", default=None)
+    p.add_argument("--save-marketing", action="store_true")
+    p.add_argument("--pin", metavar="NAME:VERSION", default=None)
+    p.set_defaults(func=_cmd_models)
+
+    args = parser.parse_args(argv)
+    with pd.option_context("display.width", 200, "display.max_columns", 20):
+        args.func(args)
+
+
+if __name__ == "__main__":
+    main()
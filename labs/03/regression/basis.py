@@ -0,0 +1,188 @@
+"""Basis-expansion regression and one-pass polynomial degree selection.
+
+``design_matrix`` fills a preallocated array column by column (each
+polynomial power is the previous column times x, spline hinges are built in
+place), so no intermediate copies of the data are made.
+
+``select_degree`` grows a thin QR factorisation one column per degree for
+all 30 students/03 problems at once. Column k+1 is ``t * q_k``
+orthogonalised against ``q_0..q_k``, which spans the same space as ``t^k``
+but stays well conditioned. Adding column q changes the residual by
+``-q (q^T y)`` and the hat diagonal by ``q^2``, so RSS, AIC and the exact
+leave-one-out (PRESS) error of every degree fall out of the same pass.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .datasets import PROBLEMS_DIR, load_problems
+from .design import information_criteria
+
+KINDS = ("poly", "spline", "log", "power")
+
+
+def _scale(x, lo, hi):
+    # Map [lo, hi] to [-1, 1] so that high powers stay representable.
+    span = np.where(hi > lo, hi - lo, 1.0)
+    return (2.0 * x - (lo + hi)) / span
+
+
+def design_matrix(x, kind="poly", degree=2, knots=(), power=0.5, out=None):
+    """Build the basis for 1-D ``x``, writing into ``out`` if given.
+
+    - ``poly``: 1, x, ..., x^degree
+    - ``spline``: cubic truncated power basis with the given interior knots
+    - ``log``: 1, log(x)
+    - ``power``: 1, x^power
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    n_cols = {
+        "poly": degree + 1,
+        "spline": 4 + len(knots),
+        "log": 2,
+        "power": 2,
+    }[kind]
+    if out is None:
+        out = np.empty((len(x), n_cols))
+    out[:, 0] = 1.0
+    if kind == "log":
+        np.log(x, out=out[:, 1])
+    elif kind == "power":
+        np.power(x, power, out=out[:, 1])
+    else:
+        n_poly = degree + 1 if kind == "poly" else 4
+        for k in range(1, n_poly):
+            np.multiply(out[:, k - 1], x, out=out[:, k])
+        for j, knot in enumerate(knots):
+            col = out[:, n_poly + j]
+            np.subtract(x, knot, out=col)
+            np.maximum(col, 0.0, out=col)
+            col **= 3
+    return out
+
+
+class BasisRegression:
+    """Least-squares fit on a fixed basis of one feature.
+
+    ``x`` is rescaled to [-1, 1] for ``poly`` and ``spline`` (knots are given
+    in the original units). Spline knots default to the quartiles.
+    """
+
+    def __init__(self, kind="poly", degree=2, knots=None, power=0.5):
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}")
+        self.kind = kind
+        self.degree = degree
+        self.knots = knots
+        self.power = power
+
+    def _design(self, x):
+        x = np.asarray(x, dtype=np.float64).ravel()
+        if self.kind in ("poly", "spline"):
+            x = _scale(x, self.x_min_, self.x_max_)
+        knots = _scale(np.asarray(self.knots_), self.x_min_, self.x_max_)
+        return design_matrix(x, self.kind, self.degree, knots, self.power)
+
+    def fit(self, x, y):
+        x = np.asarray(x, dtype=np.float64).ravel()
+        self.x_min_, self.x_max_ = x.min(), x.max()
+        if self.kind == "spline" and self.knots is None:
+            self.knots_ = np.quantile(x, [0.25, 0.5, 0.75])
+        else:
+            self.knots_ = np.asarray(self.knots if self.knots is not None else [])
+        D = self._design(x)
+        self.coef_, *_ = np.linalg.lstsq(D, y, rcond=None)
+        resid = y - D @ self.coef_
+        self.rss_ = float(resid @ resid)
+        return self
+
+    def predict(self, x):
+        return self._design(x) @ self.coef_
+
+
+def degree_scan(x, y, n, max_degree=5, tol=1e-10):
+    """RSS and PRESS for degrees 0..max_degree of every row of a padded batch.
+
+    ``x``, ``y`` are (m x n_max) with ``n[i]`` real rows. Returns (rss, press,
+    rank), each of shape (m, max_degree + 1).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = np.asarray(n)
+    mask = (np.arange(x.shape[1]) < n[:, None]).astype(np.float64)
+    lo = np.where(mask > 0, x, np.inf).min(axis=1, keepdims=True)
+    hi = np.where(mask > 0, x, -np.inf).max(axis=1, keepdims=True)
+    t = _scale(x, lo, hi) * mask
+    y = y * mask
+
+    m, n_max = x.shape
+    Q = np.zeros((m, n_max, max_degree + 1))
+    resid = y.copy()
+    hat = np.zeros_like(y)
+    rss = np.empty((m, max_degree + 1))
+    press = np.empty_like(rss)
+    rank = np.zeros((m, max_degree + 1), dtype=int)
+
+    v = mask.copy()
+    for k in range(max_degree + 1):
+        if k:
+            v = t * Q[:, :, k - 1]
+        v_norm = np.sqrt((v * v).sum(axis=1))
+        # Two Gram-Schmidt passes keep the columns orthogonal to working
+        # precision.
+        for _ in range(2):
+            if k:
+                proj = np.einsum("mik,mi->mk", Q[:, :, :k], v)
+                v = v - np.einsum("mik,mk->mi", Q[:, :, :k], proj)
+        norm = np.sqrt((v * v).sum(axis=1))
+        ok = norm > tol * np.maximum(v_norm, 1e-300)
+        q = np.where(ok[:, None], v / np.where(ok, norm, 1.0)[:, None], 0.0)
+        Q[:, :, k] = q
+
+        resid -= q * (q * y).sum(axis=1, keepdims=True)
+        hat += q * q
+        rss[:, k] = (resid * resid).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loo = np.where(mask > 0, resid / (1.0 - hat), 0.0)
+        press[:, k] = (loo * loo).sum(axis=1)
+        rank[:, k] = rank[:, k - 1] + ok if k else ok
+    return rss, press, rank
+
+
+def select_degree(max_degree=5, criterion="aic", data_dir=PROBLEMS_DIR):
+    """Pick the polynomial degree of every students/03 problem in one pass.
+
+    ``criterion`` is ``"aic"``, ``"bic"`` or ``"cv"`` (exact leave-one-out
+    RMSE). The table compares the chosen degree with the straight line.
+    """
+    if criterion not in ("aic", "bic", "cv"):
+        raise ValueError("criterion must be 'aic', 'bic' or 'cv'")
+    problems = load_problems(data_dir)
+    n = problems["n"]
+    rss, press, rank = degree_scan(problems["x"], problems["y"], n, max_degree)
+
+    # ``rank`` counts the intercept, the statsmodels convention used by
+    # information_criteria everywhere else.
+    aic, bic = information_criteria(np.maximum(rss, 1e-300), n[:, None], rank)
+    loocv_rmse = np.sqrt(press / n[:, None])
+    score = {"aic": aic, "bic": bic, "cv": loocv_rmse}[criterion]
+    # Degree 0 (constant) is scanned for the QR but never selected.
+    best = 1 + np.nanargmin(score[:, 1:], axis=1)
+    rows = np.arange(len(n))
+
+    tss = rss[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = 1.0 - rss / tss[:, None]
+    return pd.DataFrame(
+        {
+            "problem": problems["names"],
+            "degree": best,
+            "r2": r2[rows, best],
+            "rmse": np.sqrt(rss[rows, best] / n),
+            "loocv_rmse": loocv_rmse[rows, best],
+            "aic": aic[rows, best],
+            "linear_r2": r2[:, 1],
+            "linear_loocv_rmse": loocv_rmse[:, 1],
+            "linear_aic": aic[:, 1],
+        }
+    )
@@ -0,0 +1,324 @@
+"""Timing comparisons for the regression module.
+
+Each ``bench_*`` function returns a DataFrame with one row per
+(method, n_rows) and the best wall time over ``repeat`` runs. Optional
+libraries (sklearn, statsmodels) are skipped when not installed, and slow
+reference methods are only run up to a size cap.
+"""
+
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SIZES = [10**k for k in range(3, 9)]
+
+
+def best_time(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func):
+    """Peak bytes allocated while running ``func`` (NumPy reports to tracemalloc)."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def simple_data(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0.0, 100.0, n)
+    y = 3.0 + 0.5 * x + rng.normal(0.0, 5.0, n)
+    return x, y
+
+
+def _iterrows(df):
+    sumx = sumy = sumxy = sumx2 = 0.0
+    n = df.shape[0]
+    for _, row in df.iterrows():
+        sumx += row["x"]
+        sumy += row["y"]
+        sumxy += row["x"] * row["y"]
+        sumx2 += row["x"] * row["x"]
+    xm, ym = sumx / n, sumy / n
+    a1 = (n * sumxy - sumx * sumy) / (n * sumx2 - sumx * sumx)
+    a0 = ym - a1 * xm
+    st = sr = 0.0
+    for _, row in df.iterrows():
+        st += (row["y"] - ym) ** 2
+        sr += (row["y"] - a1 * row["x"] - a0) ** 2
+    return a0, a1, st, sr
+
+
+def bench_closed_form(sizes=DEFAULT_SIZES, repeat=3, iterrows_max=10**5):
+    """Compare ``least_squares`` with iterrows, polyfit, sklearn and statsmodels."""
+    from .closed_form import least_squares
+
+    methods = {
+        "least_squares": lambda x, y, df: least_squares(x, y),
+        "np.polyfit": lambda x, y, df: np.polyfit(x, y, 1),
+    }
+    try:
+        from sklearn.linear_model import LinearRegression
+
+        methods["sklearn"] = lambda x, y, df: LinearRegression().fit(x[:, None], y)
+    except ImportError:
+        pass
+    try:
+        import statsmodels.api as sm
+
+        methods["statsmodels"] = lambda x, y, df: sm.OLS(y, sm.add_constant(x)).fit()
+    except ImportError:
+        pass
+
+    rows = []
+    for n in sizes:
+        x, y = simple_data(n)
+        df = pd.DataFrame({"x": x, "y": y}) if n <= iterrows_max else None
+        timed = dict(methods)
+        if df is not None:
+            timed["iterrows"] = lambda x, y, df: _iterrows(df)
+        for name, func in timed.items():
+            seconds = best_time(
+                lambda: func(x, y, df), 1 if name == "iterrows" else repeat
+            )
+            rows.append({"method": name, "n_rows": n, "seconds": seconds})
+
+    table = pd.DataFrame(rows)
+    baseline = table[table.method == "least_squares"].set_index("n_rows").seconds
+    table["vs_least_squares"] = table.seconds / table.n_rows.map(baseline)
+    return table
+
+
+def bench_scoring(n_calls=10_000, n_rows=10**7, repeat=3):
+    """Per-call latency and bulk throughput of ``LinearScorer``.
+
+    Compares against the exercise2 ``predict_sales`` pattern (one-row
+    DataFrame + sklearn ``predict``) when sklearn is installed.
+    """
+    from .datasets import MARKETING_CSV, MARKETING_FEATURES
+    from .scoring import marketing_scorer
+
+    scorer = marketing_scorer(MARKETING_CSV)
+    rng = np.random.default_rng(0)
+    rows = []
+
+    def scalar_calls():
+        for tv, radio, news in calls:
+            scorer.score_one(tv, radio, news)
+
+    calls = rng.uniform(0, 300, size=(n_calls, 3)).tolist()
+    seconds = best_time(scalar_calls, repeat)
+    rows.append({"method": "score_one", "rows": n_calls, "seconds": seconds})
+
+    try:
+        from sklearn.linear_model import LinearRegression
+
+        model = LinearRegression()
+        model.coef_, model.intercept_ = scorer.coef, scorer.intercept
+        model.n_features_in_ = 3
+        model.feature_names_in_ = np.array(MARKETING_FEATURES, dtype=object)
+
+        def dataframe_calls():
+            for values in calls[:1000]:
+                model.predict(pd.DataFrame([values], columns=MARKETING_FEATURES))
+
+        seconds = best_time(dataframe_calls, 1)
+        rows.append({"method": "DataFrame + predict", "rows": 1000, "seconds": seconds})
+    except ImportError:
+        pass
+
+    X = rng.uniform(0, 300, size=(n_rows, 3))
+    out = np.empty(n_rows)
+    seconds = best_time(lambda: scorer.score(X, out=out), repeat)
+    rows.append({"method": "score (bulk)", "rows": n_rows, "seconds": seconds})
+
+    table = pd.DataFrame(rows)
+    table["us_per_row"] = 1e6 * table.seconds / table.rows
+    table["rows_per_s"] = table.rows / table.seconds
+    return table
+
+
+def bench_fused(n_rows=10**7, repeat=3):
+    """Scaler + linear model in two passes vs. the compiled single affine map."""
+    from .fused import check_equivalence, compile_pipeline
+    from .streaming import StreamingLinearRegression
+
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 300, size=(n_rows, 3))
+    y = X @ [0.05, 0.1, 0.0] + 4.6 + rng.normal(0, 1.6, n_rows)
+
+    # The fitted attributes of a StandardScaler, so sklearn is not required.
+    scaler = SimpleNamespace(mean_=X.mean(axis=0), scale_=X.std(axis=0))
+    model = StreamingLinearRegression().partial_fit(
+        (X - scaler.mean_) / scaler.scale_, y
+    )
+    fused = compile_pipeline([scaler], model)
+
+    def two_pass():
+        return model.predict((X - scaler.mean_) / scaler.scale_)
+
+    max_diff = check_equivalence(fused, lambda _: two_pass(), X)
+    rows = []
+    for name, func in [
+        ("scaler + predict", two_pass),
+        ("fused", lambda: fused.predict(X)),
+    ]:
+        rows.append(
+            {
+                "method": name,
+                "n_rows": n_rows,
+                "seconds": best_time(func, repeat),
+                "peak_mb": peak_memory(func) / 2**20,
+            }
+        )
+    table = pd.DataFrame(rows)
+    table["max_abs_diff"] = max_diff
+    return table
+
+
+def _scaling_methods(chunk_rows):
+    from scipy.linalg import cho_factor, cho_solve, solve_triangular
+
+    from .streaming import GramAccumulator
+
+    def design(X):
+        return np.column_stack([np.ones(len(X)), X])
+
+    def normal_equations(X, y):
+        A = design(X)
+        return cho_solve(cho_factor(A.T @ A), A.T @ y)
+
+    def qr(X, y):
+        Q, R = np.linalg.qr(design(X))
+        return solve_triangular(R, Q.T @ y)
+
+    def chunked(X, y):
+        stats = GramAccumulator(X.shape[1])
+        for start in range(0, len(X), chunk_rows):
+            stats.update(X[start : start + chunk_rows], y[start : start + chunk_rows])
+        coef, intercept, _ = stats.solve()
+        return np.r_[intercept, coef]
+
+    methods = {
+        "lstsq": lambda X, y: np.linalg.lstsq(design(X), y, rcond=None)[0],
+        "normal_equations": normal_equations,
+        "qr": qr,
+        "chunked": chunked,
+    }
+    try:
+        from sklearn.linear_model import LinearRegression
+
+        def sklearn(X, y):
+            model = LinearRegression().fit(X, y)
+            return np.r_[model.intercept_, model.coef_]
+
+        methods["sklearn"] = sklearn
+    except ImportError:
+        pass
+    return methods
+
+
+def bench_scaling(
+    sizes=DEFAULT_SIZES,
+    repeat=3,
+    collinearity=0.0,
+    noise=None,
+    in_memory_max=10**7,
+    chunk_rows=10**6,
+    data_dir=None,
+):
+    """Time and memory of the marketing fit for every solver as rows grow.
+
+    Data come from ``synthetic.marketing_chunk``; ``coef_error`` is the
+    largest deviation from the generating coefficients. Sizes above
+    ``in_memory_max`` are written to ``.npy`` files under ``data_dir`` (a
+    temporary directory by default) and only the chunked path is run, over
+    the memory-mapped file.
+    """
+    import tempfile
+    from pathlib import Path
+
+    from . import synthetic
+
+    noise = synthetic.MARKETING_NOISE if noise is None else noise
+    truth = np.r_[synthetic.MARKETING_INTERCEPT, synthetic.MARKETING_COEF]
+    methods = _scaling_methods(chunk_rows)
+    rows = []
+
+    def run(name, func, X, y, n, repeat):
+        result = []
+        peak = peak_memory(lambda: result.append(func(X, y)))
+        rows.append(
+            {
+                "method": name,
+                "n_rows": n,
+                "seconds": best_time(lambda: func(X, y), repeat),
+                "peak_mb": peak / 2**20,
+                "coef_error": np.abs(result[0] - truth).max(),
+            }
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            if n <= in_memory_max:
+                rng = np.random.default_rng(n)
+                X, y = synthetic.marketing_chunk(rng, n, noise, collinearity)
+                for name, func in methods.items():
+                    run(name, func, X, y, n, repeat)
+                continue
+            path = Path(data_dir or tmp) / f"marketing_{n}.npy"
+            if not path.exists():
+                synthetic.generate_marketing(
+                    path,
+                    n,
+                    noise,
+                    collinearity,
+                    seed=n,
+                    chunk_rows=chunk_rows,
+                    fmt="npy",
+                )
+            data = np.load(path, mmap_mode="r")
+            run("chunked", methods["chunked"], data[:, :-1], data[:, -1], n, 1)
+            del data
+            if data_dir is None:
+                path.unlink()
+    return pd.DataFrame(rows)
+
+
+def crossover_points(table, value="seconds"):
+    """Sizes at which the ordering of two methods by ``value`` flips.
+
+    Each row names the method that was ahead below ``n_rows`` and the one
+    that is ahead from ``n_rows`` on (smaller ``value`` wins).
+    """
+    wide = table.pivot(index="n_rows", columns="method", values=value).sort_index()
+    rows = []
+    names = list(wide.columns)
+    for i, a in enumerate(names):
+        for b in names[i + 1 :]:
+            pair = wide[[a, b]].dropna()
+            pair = pair[pair[a] != pair[b]]  # ties do not change the order
+            ahead = np.where(pair[a] < pair[b], a, b)
+            for k in np.flatnonzero(ahead[1:] != ahead[:-1]) + 1:
+                rows.append(
+                    {
+                        "n_rows": pair.index[k],
+                        "was_ahead": ahead[k - 1],
+                        "now_ahead": ahead[k],
+                        "ratio": pair[ahead[k - 1]].iloc[k] / pair[ahead[k]].iloc[k],
+                    }
+                )
+    return pd.DataFrame(
+        rows, columns=["n_rows", "was_ahead", "now_ahead", "ratio"]
+    ).sort_values("n_rows", ignore_index=True)
@@ -0,0 +1,53 @@
+"""Closed-form simple linear regression, vectorized.
+
+Computes the same quantities as the manual least-squares cells in
+Linearna_regresija.ipynb (a0, a1, syx, r2, r) with NumPy reductions instead
+of two ``df.iterrows()`` passes.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class LeastSquaresFit(NamedTuple):
+    a0: float
+    a1: float
+    syx: float
+    r2: float
+    r: float
+
+
+def least_squares(x, y):
+    """Fit y = a0 + a1 * x.
+
+    ``syx`` is the standard error of the estimate sqrt(sr / (n - 2)) and
+    ``r`` carries the sign of the slope (the notebook prints sqrt(r2)).
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if x.shape != y.shape:
+        raise ValueError(f"x and y differ in length: {x.size} != {y.size}")
+    n = x.size
+    if n < 3:
+        raise ValueError("need at least 3 points for syx")
+
+    xm = x.mean()
+    ym = y.mean()
+    dx = x - xm
+    dy = y - ym
+    sxx = dx @ dx
+    sxy = dx @ dy
+    st = dy @ dy
+
+    a1 = sxy / sxx
+    a0 = ym - a1 * xm
+    sr = max(st - a1 * sxy, 0.0)
+    r2 = (st - sr) / st
+    return LeastSquaresFit(
+        a0=float(a0),
+        a1=float(a1),
+        syx=float(np.sqrt(sr / (n - 2))),
+        r2=float(r2),
+        r=float(np.copysign(np.sqrt(r2), a1)),
+    )
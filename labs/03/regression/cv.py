@@ -0,0 +1,127 @@
+"""Repeated K-fold cross-validation without refitting each fold.
+
+The Gram matrix ``A^T A`` and ``A^T y`` of the full design ``A = [1, X]``
+are formed once. A fold's training system is the global one minus the
+held-out rows' contribution, and the held-out contributions of all folds
+in a repeat come from one ``np.add.reduceat`` over precomputed per-row outer
+products. Repeats are spread over a process pool.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .datasets import MARKETING_CSV, MARKETING_FEATURES, MARKETING_TARGET
+from .design import centered_design
+
+_worker_state = {}
+
+
+def _init_worker(A, yc):
+    _worker_state["A"] = A
+    _worker_state["y"] = yc
+    _worker_state["rows_AA"] = A[:, :, None] * A[:, None, :]
+    _worker_state["rows_Ay"] = A * yc[:, None]
+    _worker_state["G"] = A.T @ A
+    _worker_state["b"] = A.T @ yc
+
+
+def _run_repeats(seeds, n_splits):
+    """Scores for one repeat per seed; each repeat has its own generator."""
+    A = _worker_state["A"]
+    y = _worker_state["y"]
+    rows_AA = _worker_state["rows_AA"]
+    rows_Ay = _worker_state["rows_Ay"]
+    G = _worker_state["G"]
+    b = _worker_state["b"]
+
+    n = len(y)
+    sizes = np.full(n_splits, n // n_splits)
+    sizes[: n % n_splits] += 1
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    fold_of_row = np.repeat(np.arange(n_splits), sizes)
+
+    out = np.empty((len(seeds), n_splits, 3))
+    for r, seed in enumerate(seeds):
+        perm = np.random.default_rng(seed).permutation(n)
+        G_train = G - np.add.reduceat(rows_AA[perm], starts)
+        b_train = b - np.add.reduceat(rows_Ay[perm], starts)
+        coef = np.linalg.solve(G_train, b_train[:, :, None])[:, :, 0]
+
+        y_te = y[perm]
+        err = y_te - np.einsum("ij,ij->i", A[perm], coef[fold_of_row])
+        sse = np.add.reduceat(err * err, starts)
+        sae = np.add.reduceat(np.abs(err), starts)
+        y_mean = np.add.reduceat(y_te, starts) / sizes
+        sst = np.add.reduceat((y_te - y_mean[fold_of_row]) ** 2, starts)
+
+        out[r, :, 0] = 1.0 - sse / sst
+        out[r, :, 1] = sae / sizes
+        out[r, :, 2] = np.sqrt(sse / sizes)
+    return out
+
+
+def repeated_kfold(X, y, n_splits=5, n_repeats=1000, seed=0, n_jobs=None):
+    """Return per-fold R², MAE and RMSE for ``n_repeats`` shuffled K-fold splits.
+
+    The result has one row per (repeat, fold). ``n_jobs=None`` uses every CPU,
+    ``n_jobs=1`` runs in the current process. Every repeat draws its shuffle
+    from its own child of ``SeedSequence(seed)``, so the folds and scores do
+    not depend on ``n_jobs`` or the machine.
+    """
+    A, yc, _, _ = centered_design(X, y)
+    if not 2 <= n_splits <= len(yc):
+        raise ValueError(f"n_splits must be between 2 and {len(yc)}, got {n_splits}")
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    n_jobs = min(n_jobs, n_repeats)
+    seeds = np.random.SeedSequence(seed).spawn(n_repeats)
+    chunks = np.array_split(np.arange(n_repeats), n_jobs)
+
+    if n_jobs == 1:
+        _init_worker(A, yc)
+        results = [_run_repeats(seeds, n_splits)]
+    else:
+        with ProcessPoolExecutor(
+            n_jobs, initializer=_init_worker, initargs=(A, yc)
+        ) as pool:
+            futures = [
+                pool.submit(_run_repeats, [seeds[i] for i in c], n_splits)
+                for c in chunks
+            ]
+            results = [f.result() for f in futures]
+
+    scores = np.concatenate(results).reshape(-1, 3)
+    return pd.DataFrame(
+        {
+            "repeat": np.repeat(np.arange(n_repeats), n_splits),
+            "fold": np.tile(np.arange(n_splits), n_repeats),
+            "r2": scores[:, 0],
+            "mae": scores[:, 1],
+            "rmse": scores[:, 2],
+        }
+    )
+
+
+def summarize_cv(scores, percentiles=(2.5, 50, 97.5)):
+    """Mean, standard deviation and percentiles of each metric."""
+    metrics = scores[["r2", "mae", "rmse"]]
+    table = metrics.agg(["mean", "std"]).T
+    for q in percentiles:
+        table[f"p{q:g}"] = np.percentile(metrics, q, axis=0)
+    return table
+
+
+def cv_marketing(n_splits=5, n_repeats=1000, seed=0, n_jobs=None, path=MARKETING_CSV):
+    """Repeated K-fold CV of Sales ~ TV + Radio + Newspaper."""
+    data = pd.read_csv(path)
+    return repeated_kfold(
+        data[MARKETING_FEATURES],
+        data[MARKETING_TARGET],
+        n_splits=n_splits,
+        n_repeats=n_repeats,
+        seed=seed,
+        n_jobs=n_jobs,
+    )
@@ -0,0 +1,83 @@
+"""Loaders for the datasets used in labs/03 and students/03."""
+
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PROBLEMS_DIR = REPO_ROOT / "students" / "03" / "data"
+MARKETING_CSV = REPO_ROOT / "labs" / "03" / "marketing.csv"
+CO2_CSV = REPO_ROOT / "labs" / "03" / "data.csv"
+SALARIES_CSV = REPO_ROOT / "labs" / "01" / "Salaries.csv"
+
+MARKETING_FEATURES = ["TV", "Radio", "Newspaper"]
+MARKETING_TARGET = "Sales"
+CO2_FEATURES = ["Weight", "Volume"]
+CO2_TARGET = "CO2"
+SALARIES_FEATURES = ["phd", "service"]
+SALARIES_TARGET = "salary"
+
+MODELS = {
+    "marketing": (MARKETING_CSV, MARKETING_FEATURES, MARKETING_TARGET),
+    "co2": (CO2_CSV, CO2_FEATURES, CO2_TARGET),
+    "salaries": (SALARIES_CSV, SALARIES_FEATURES, SALARIES_TARGET),
+}
+
+
+def read_csv_array(path):
+    """Read a numeric CSV with one header line into (columns, float64 array)."""
+    with open(path) as f:
+        columns = f.readline().strip().split(",")
+        values = np.loadtxt(f, delimiter=",", ndmin=2)
+    return columns, values
+
+
+def load_problems(data_dir=PROBLEMS_DIR):
+    """Load every ``NN_name.csv`` problem into zero-padded batch arrays.
+
+    Returns a dict with ``names``, ``features``, ``targets`` (lists of length
+    m), ``x`` and ``y`` (m x n_max float64, padded with zeros) and ``n``
+    (number of real rows per problem).
+    """
+    paths = sorted(Path(data_dir).glob("*.csv"))
+    if not paths:
+        raise FileNotFoundError(f"no CSV files in {data_dir}")
+
+    names, features, targets, columns = [], [], [], []
+    for path in paths:
+        header, values = read_csv_array(path)
+        if values.shape[1] != 2:
+            raise ValueError(f"{path.name}: expected 2 columns, got {values.shape[1]}")
+        names.append(path.stem)
+        features.append(header[0])
+        targets.append(header[1])
+        columns.append(values)
+
+    n = np.array([len(v) for v in columns])
+    x = np.zeros((len(columns), n.max()))
+    y = np.zeros_like(x)
+    for i, values in enumerate(columns):
+        x[i, : n[i]] = values[:, 0]
+        y[i, : n[i]] = values[:, 1]
+
+    return {
+        "names": names,
+        "features": features,
+        "targets": targets,
+        "x": x,
+        "y": y,
+        "n": n,
+    }
+
+
+def load_model_data(name):
+    """Return (X, y, feature_names) for one of the lab 03 models in ``MODELS``."""
+    import pandas as pd
+
+    path, features, target = MODELS[name]
+    data = pd.read_csv(path, usecols=features + [target])
+    return (
+        data[features].to_numpy(np.float64),
+        data[target].to_numpy(np.float64),
+        features,
+    )
@@ -0,0 +1,44 @@
+"""Design-matrix helpers shared by the regression engines."""
+
+import numpy as np
+
+
+def as_2d(X):
+    X = np.asarray(X, dtype=np.float64)
+    return X[:, None] if X.ndim == 1 else X
+
+
+def centered_design(X, y):
+    """Return ``A = [1, X - mean(X)]``, ``y - mean(y)`` and the two means.
+
+    Centring keeps Gram matrices well conditioned and does not change the
+    fitted values of a model with an intercept. Coefficients solved on
+    ``A`` map back with :func:`uncenter`.
+    """
+    X = as_2d(X)
+    y = np.asarray(y, dtype=np.float64)
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    A = np.column_stack([np.ones(len(X)), X - x_mean])
+    return A, y - y_mean, x_mean, y_mean
+
+
+def uncenter(coef, x_mean, y_mean):
+    """Map ``[c0, slopes]`` fitted on a centred design to ``[intercept, slopes]``.
+
+    Works on a single vector or a stack with coefficients in the last axis.
+    """
+    coef = np.array(coef, dtype=np.float64)
+    coef[..., 0] += y_mean - coef[..., 1:] @ x_mean
+    return coef
+
+
+def information_criteria(rss, n, k_params):
+    """Gaussian AIC and BIC as statsmodels' OLS reports them.
+
+    ``k_params`` counts the intercept. Broadcasts over arrays of RSS, n and k.
+    """
+    rss = np.asarray(rss, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        llf = -0.5 * n * (np.log(2 * np.pi) + np.log(rss / n) + 1)
+    return -2 * llf + 2 * k_params, -2 * llf + k_params * np.log(n)
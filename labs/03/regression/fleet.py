@@ -0,0 +1,305 @@
+"""Run every students/03 submission headlessly and rank the results.
+
+Each submission (plain script, marimo app or notebook under
+``students/03/exercise`` and ``exercise2``) is copied into its own scratch
+directory with its data paths rewritten to the local catalog: any string
+literal naming a known CSV (``/workspaces/2025-sci-prog/...``,
+``../data/...``, ``sample_data/...`` or a bare file name) becomes the
+absolute path of that file. The copy then runs in a fresh interpreter with
+``MPLBACKEND=Agg`` and ``-X importtime`` under a per-run timeout, from a
+process pool.
+
+Every run records wall time, the interpreter's peak RSS, the total import
+time and the last R², RMSE, MSE and MAE printed to stdout. The leaderboard
+ranks successful runs by wall time in 10% bands, higher R² first within a
+band, and is written as JSON and CSV; ``check_leaderboard`` compares it
+with a saved baseline so it can gate changes to the runtime or to the
+reported fits.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .datasets import PROBLEMS_DIR, REPO_ROOT
+
+STUDENTS_DIR = REPO_ROOT / "students" / "03"
+SUBMISSION_DIRS = [STUDENTS_DIR / "exercise", STUDENTS_DIR / "exercise2"]
+ORIGINAL_ROOT = "/workspaces/2025-sci-prog"
+DEFAULT_TIMEOUT = 120.0
+
+METRICS = {
+    "r2": r"(?:r\^?2|r²|r-squared|r_squared|r squared|r2_score)",
+    "rmse": r"(?:rmse|root mean squared? error)",
+    "mse": r"\b(?<!root )(?:mse|mean squared? error)",
+    "mae": r"(?:mae|mean absolute error)",
+}
+# The value either follows the label directly ("R2 0.91") or comes after a
+# ":" / "=" / "is" / "of" separator, so digits inside the label text
+# ("R2 score for 3 features: 0.9") are never taken as the value.
+NUMBER = (
+    r"(?:\s*|[^\n:=]{0,40}?(?:[:=]|\b(?:is|of)\b)\s*)\$?"
+    r"(?<![\w.])(-?\d+(?:\.\d+)?(?:e[-+]?\d+)?)(\s*%)?"
+)
+RUNTIME_TOL = 0.1
+
+# Runs inside the child interpreter: executes the submission as __main__ and
+# writes its status and peak RSS to the JSON file named by argv[2].
+BOOTSTRAP = """
+import json, resource, runpy, sys, time, traceback
+script, result_path = sys.argv[1], sys.argv[2]
+sys.argv = [script]
+result = {"status": "ok", "error": None}
+start = time.perf_counter()
+try:
+    runpy.run_path(script, run_name="__main__")
+except SystemExit as exc:
+    if exc.code not in (None, 0):
+        result.update(status="error", error=f"SystemExit: {exc.code}")
+except BaseException as exc:
+    traceback.print_exc()
+    result.update(status="error", error=f"{type(exc).__name__}: {exc}"[:300])
+result["run_s"] = time.perf_counter() - start
+result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+with open(result_path, "w") as f:
+    json.dump(result, f)
+"""
+
+
+def data_catalog():
+    """File name -> absolute path for every CSV the submissions may read."""
+    paths = sorted(Path(PROBLEMS_DIR).glob("*.csv"))
+    paths += [REPO_ROOT / "labs" / "03" / "marketing.csv"]
+    paths += [REPO_ROOT / "labs" / "03" / "data.csv"]
+    return {path.name: path for path in paths if path.exists()}
+
+
+def find_submissions(dirs=SUBMISSION_DIRS):
+    """Name -> path of every .py / .ipynb submission (one level of folders)."""
+    found = {}
+    for root in dirs:
+        for path in sorted(root.glob("*.py")) + sorted(root.glob("*/*.py")):
+            if "__marimo__" not in path.parts:
+                found[path.relative_to(STUDENTS_DIR).with_suffix("").as_posix()] = path
+        for path in sorted(root.glob("*.ipynb")):
+            found[path.relative_to(STUDENTS_DIR).with_suffix("").as_posix()] = path
+    return found
+
+
+def notebook_source(path):
+    """Code cells of a notebook as one script, without IPython magics."""
+    cells = json.loads(Path(path).read_text(encoding="utf-8"))["cells"]
+    lines = []
+    for cell in cells:
+        if cell["cell_type"] == "code":
+            source = "".join(cell["source"])
+            lines += [
+                line
+                for line in source.splitlines()
+                if not line.lstrip().startswith(("%", "!"))
+            ]
+            lines.append("")
+    return "\n".join(lines)
+
+
+def rewrite_paths(source, catalog):
+    """Point every string literal naming a catalog CSV at its local copy."""
+
+    def replace(match):
+        name = match.group(2).replace("\\", "/").rsplit("/", 1)[-1]
+        if name in catalog:
+            return repr(str(catalog[name]))
+        return match.group(0).replace(ORIGINAL_ROOT, str(REPO_ROOT))
+
+    source = re.sub(r"(['\"])([^'\"\n]*\.csv)\1", replace, source)
+    return source.replace(ORIGINAL_ROOT, str(REPO_ROOT))
+
+
+def parse_metrics(text):
+    """Last value printed after each metric label, or None.
+
+    R² printed as a percentage (with a ``%`` sign or above 1) is scaled back
+    to a fraction.
+    """
+    found = {}
+    for name, label in METRICS.items():
+        values = re.findall(label + NUMBER, text, flags=re.IGNORECASE)
+        if not values:
+            found[name] = None
+            continue
+        number, percent = values[-1]
+        value = float(number)
+        if name == "r2" and (percent or value > 1.0):
+            value /= 100.0
+        found[name] = value
+    return found
+
+
+def _import_time(stderr):
+    """Total self time in seconds from ``-X importtime`` lines, and the rest."""
+    total_us, rest = 0, []
+    for line in stderr.splitlines():
+        if line.startswith("import time:"):
+            fields = line.split("|")
+            if fields[0].split(":")[1].strip().isdigit():
+                total_us += int(fields[0].split(":")[1])
+        else:
+            rest.append(line)
+    return total_us / 1e6, "\n".join(rest)
+
+
+def run_submission(name, path, timeout=DEFAULT_TIMEOUT, catalog=None):
+    """Run one submission in a scratch directory and return its record."""
+    catalog = catalog or data_catalog()
+    path = Path(path)
+    source = (
+        notebook_source(path)
+        if path.suffix == ".ipynb"
+        else path.read_text(encoding="utf-8", errors="replace")
+    )
+    record = {"name": name, "path": str(path.relative_to(REPO_ROOT))}
+    with tempfile.TemporaryDirectory(prefix="fleet-") as scratch:
+        script = Path(scratch) / (path.stem + ".py")
+        script.write_text(rewrite_paths(source, catalog), encoding="utf-8")
+        result_path = Path(scratch) / "result.json"
+        env = dict(os.environ, MPLBACKEND="Agg", PYTHONWARNINGS="ignore")
+        command = [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            BOOTSTRAP,
+            str(script),
+            str(result_path),
+        ]
+        start = time.perf_counter()
+        try:
+            proc = subprocess.run(
+                command,
+                cwd=scratch,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired as exc:
+            record.update(status="timeout", wall_s=time.perf_counter() - start)
+            record["error"] = f"no result after {timeout:g} s"
+            stdout = exc.stdout or ""
+            stdout = (
+                stdout.decode(errors="replace") if isinstance(stdout, bytes) else stdout
+            )
+            record.update(parse_metrics(stdout))
+            return record
+        record["wall_s"] = time.perf_counter() - start
+        record["import_s"], stderr = _import_time(proc.stderr)
+        if result_path.exists():
+            record.update(json.loads(result_path.read_text()))
+        else:
+            record.update(status="crashed", error=stderr.strip()[-300:] or None)
+        record.update(parse_metrics(proc.stdout))
+    return record
+
+
+def _run(args):
+    return run_submission(*args)
+
+
+def run_fleet(submissions=None, timeout=DEFAULT_TIMEOUT, n_jobs=None):
+    """Run all submissions in a process pool; return the ranked leaderboard."""
+    submissions = submissions or find_submissions()
+    catalog = data_catalog()
+    jobs = [(name, path, timeout, catalog) for name, path in submissions.items()]
+    with ProcessPoolExecutor(max_workers=n_jobs or os.cpu_count()) as pool:
+        records = list(pool.map(_run, jobs))
+    return rank(pd.DataFrame(records))
+
+
+def rank(table, runtime_tol=RUNTIME_TOL):
+    """Successful runs first, then by runtime and R².
+
+    Wall times are bucketed on a log scale with buckets ``runtime_tol`` wide
+    (10% by default), so runs whose times differ only by noise share a
+    bucket and are ordered by higher R²; wall time breaks remaining ties.
+    """
+    wall = table.wall_s.clip(lower=1e-3)
+    table = table.assign(
+        _failed=table.status != "ok",
+        _bucket=np.floor(np.log(wall) / np.log1p(runtime_tol)),
+        _r2=-table.r2.fillna(-1e300),
+    )
+    table = table.sort_values(["_failed", "_bucket", "_r2", "wall_s"]).drop(
+        columns=["_failed", "_bucket", "_r2"]
+    )
+    table.insert(0, "rank", range(1, len(table) + 1))
+    return table.reset_index(drop=True)
+
+
+def write_leaderboard(table, stem):
+    """Write ``stem.json`` and ``stem.csv``; return the two paths."""
+    stem = Path(stem)
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    json_path, csv_path = stem.with_suffix(".json"), stem.with_suffix(".csv")
+    table.to_json(json_path, orient="records", indent=2)
+    table.to_csv(csv_path, index=False)
+    return json_path, csv_path
+
+
+def read_leaderboard(path):
+    path = Path(path)
+    return pd.read_json(path) if path.suffix == ".json" else pd.read_csv(path)
+
+
+def check_leaderboard(table, baseline, max_slowdown=1.5, min_seconds=0.5, r2_tol=1e-6):
+    """Rows where a submission got worse against ``baseline``.
+
+    A submission regresses when it stops succeeding, when its wall time
+    exceeds ``max_slowdown`` times the baseline (and ``min_seconds``, to
+    ignore noise on very short runs), or when its reported R² changes by
+    more than ``r2_tol`` or is printed in only one of the two runs.
+    Submissions present in only one of the two leaderboards are reported as
+    ``missing`` or ``new``. An empty result means the gate passes.
+    """
+    merged = table.merge(
+        baseline, on="name", how="outer", suffixes=("", "_base"), indicator=True
+    )
+    missing = merged._merge == "right_only"
+    new = merged._merge == "left_only"
+    broke = (merged.status_base == "ok") & (merged.status != "ok") & ~missing
+    slower = (merged.wall_s > max_slowdown * merged.wall_s_base) & (
+        merged.wall_s > min_seconds
+    )
+    # Losing (or gaining) a printed R² counts as a change too.
+    moved = ((merged.r2 - merged.r2_base).abs() > r2_tol) | (
+        merged.r2.isna() != merged.r2_base.isna()
+    )
+    moved &= ~(missing | new)
+    flagged = missing | new | broke | slower | moved
+    problems = merged[flagged].copy()
+    problems["reason"] = np.select(
+        [missing[flagged], new[flagged], broke[flagged], slower[flagged]],
+        ["missing", "new", "failed", "slower"],
+        "r2 changed",
+    )
+    return problems[
+        [
+            "name",
+            "reason",
+            "status",
+            "status_base",
+            "wall_s",
+            "wall_s_base",
+            "r2",
+            "r2_base",
+        ]
+    ].reset_index(drop=True)
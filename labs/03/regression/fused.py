@@ -0,0 +1,160 @@
+"""Fold affine preprocessing into the coefficients of a linear model.
+
+A scaler followed by a linear model is ``((x - m) / s) @ w + c``, which is
+the single affine map ``x @ (w / s) + (c - (m / s) @ w)``. Compiling the
+pipeline once at export time turns inference into one dot product with no
+intermediate scaled copy of the batch.
+
+Supported steps are fitted ``StandardScaler`` / ``MinMaxScaler`` objects,
+:class:`Affine` for any fixed ``x @ W + b`` map, and :class:`OneHotMap` for
+categorical columns with a fixed category list, which compiles to a
+per-category lookup table added to the numeric score.
+"""
+
+import numpy as np
+
+from .design import as_2d
+
+
+class Affine:
+    """Fixed ``x @ W + b``; ``W`` may be a vector for an elementwise scale."""
+
+    def __init__(self, W, b=0.0):
+        self.W = np.asarray(W, dtype=np.float64)
+        self.b = np.asarray(b, dtype=np.float64)
+
+    def transform(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        return (X * self.W if self.W.ndim == 1 else X @ self.W) + self.b
+
+
+class OneHotMap:
+    """One-hot encoding of an integer-code column against fixed categories.
+
+    Unknown codes encode as all zeros, like ``handle_unknown="ignore"``.
+    """
+
+    def __init__(self, categories):
+        self.categories = np.asarray(categories)
+
+    def transform(self, codes):
+        codes = np.asarray(codes).ravel()
+        return (codes[:, None] == self.categories[None, :]).astype(np.float64)
+
+
+def _shift_scale(center, scale, n_inputs):
+    """Affine form of ``(x - center) / scale``; None means no shift / scaling."""
+    center = np.zeros(n_inputs) if center is None else center
+    scale = np.ones(n_inputs) if scale is None else scale
+    center = np.asarray(center, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+    return np.diag(1.0 / scale), -center / scale
+
+
+def as_affine(step, n_inputs):
+    """Return (W, b) with W of shape (n_inputs, n_outputs) for a numeric step.
+
+    Handles ``Affine`` and fitted MinMaxScaler, RobustScaler and
+    StandardScaler (recognised by their fitted attributes); any other step
+    raises TypeError.
+    """
+    if isinstance(step, Affine):
+        W = np.diag(step.W) if step.W.ndim == 1 else step.W
+        return W, np.broadcast_to(step.b, (W.shape[1],)).astype(np.float64)
+    if hasattr(step, "min_") and hasattr(step, "scale_"):  # MinMaxScaler
+        return np.diag(step.scale_), np.asarray(step.min_, dtype=np.float64)
+    if hasattr(step, "center_") and hasattr(step, "scale_"):  # RobustScaler
+        return _shift_scale(step.center_, step.scale_, n_inputs)
+    if hasattr(step, "mean_") and hasattr(step, "scale_"):  # StandardScaler
+        mean = step.mean_ if getattr(step, "with_mean", True) else None
+        scale = step.scale_ if getattr(step, "with_std", True) else None
+        return _shift_scale(mean, scale, n_inputs)
+    raise TypeError(f"cannot fold {type(step).__name__} into an affine map")
+
+
+class FusedLinearModel:
+    """Linear model with preprocessing folded into ``coef_`` and ``intercept_``.
+
+    ``predict(X, codes)`` takes the raw numeric columns and, if the pipeline
+    had ``OneHotMap`` steps, a matrix of their raw integer codes.
+    """
+
+    def __init__(self, coef, intercept, lookups=(), categories=(), feature_names=None):
+        self.coef_ = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept_ = float(intercept)
+        self.lookups = [np.asarray(t, dtype=np.float64) for t in lookups]
+        self.categories = [np.asarray(c) for c in categories]
+        self.feature_names = feature_names
+
+    def predict(self, X, codes=None):
+        out = as_2d(X) @ self.coef_
+        out += self.intercept_
+        if self.lookups:
+            codes = np.asarray(codes).reshape(len(out), -1)
+            for k, (table, cats) in enumerate(zip(self.lookups, self.categories)):
+                # Dense positions of each code in the category list; codes not
+                # in the list contribute nothing.
+                pos = np.searchsorted(cats, codes[:, k])
+                pos = np.clip(pos, 0, len(cats) - 1)
+                hit = cats[pos] == codes[:, k]
+                out += np.where(hit, table[pos], 0.0)
+        return out
+
+
+def compile_pipeline(steps, model, one_hot=(), feature_names=None):
+    """Collapse numeric ``steps`` and ``one_hot`` maps into one linear model.
+
+    ``steps`` are applied in order to the numeric columns. ``model`` is the
+    fitted linear estimator; its coefficients must be ordered
+    as the transformed numeric columns followed by each one-hot block.
+    ``steps`` may also be an sklearn ``Pipeline`` ending in the estimator.
+    """
+    if hasattr(steps, "steps"):
+        *steps, model = [step for _, step in steps.steps]
+
+    coef = np.ravel(np.asarray(model.coef_, dtype=np.float64))
+    intercept = float(np.ravel(model.intercept_)[0])
+    block_sizes = [len(m.categories) for m in one_hot]
+    n_numeric_out = len(coef) - sum(block_sizes)
+
+    # Push the coefficients back through the numeric steps, last step first.
+    w = coef[:n_numeric_out]
+    for step in reversed(list(steps)):
+        n_in = _n_inputs(step, len(w))
+        W, b = as_affine(step, n_in)
+        intercept += b @ w
+        w = W @ w
+
+    lookups, offset = [], n_numeric_out
+    for size in block_sizes:
+        lookups.append(coef[offset : offset + size])
+        offset += size
+
+    order = [np.argsort(m.categories) for m in one_hot]
+    return FusedLinearModel(
+        w,
+        intercept,
+        lookups=[t[o] for t, o in zip(lookups, order)],
+        categories=[m.categories[o] for m, o in zip(one_hot, order)],
+        feature_names=feature_names,
+    )
+
+
+def _n_inputs(step, n_outputs):
+    if isinstance(step, Affine) and step.W.ndim == 2:
+        return step.W.shape[0]
+    return n_outputs
+
+
+def check_equivalence(fused, reference_predict, X, codes=None, rtol=1e-9, atol=1e-9):
+    """Compare the fused model with the original pipeline on ``X``.
+
+    Returns the maximum absolute difference and raises ``AssertionError`` if
+    any prediction differs beyond ``rtol`` / ``atol``.
+    """
+    expected = np.asarray(reference_predict(X), dtype=np.float64).ravel()
+    got = fused.predict(X, codes) if codes is not None else fused.predict(X)
+    diff = np.abs(got - expected)
+    if not np.all(diff <= atol + rtol * np.abs(expected)):
+        raise AssertionError(f"fused model differs by up to {diff.max():.3e}")
+    return float(diff.max())
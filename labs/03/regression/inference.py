@@ -0,0 +1,175 @@
+"""Standard errors, t/F tests and condition numbers from the normal equations.
+
+This covers what the labs read off ``sm.OLS(y, X).fit().summary()`` without
+importing statsmodels. Everything is computed from the Cholesky factor
+``R`` of the centred Gram matrix ``G = A^T A = R^T R`` of
+``A = [1, X - mean(X)]`` that the fits already form, so nothing touches the
+rows again, and a stack of R's (one per model) is handled in one batched
+triangular solve: the 30 students/03 problems take a single call. Working
+from ``R`` rather than inverting ``G`` avoids squaring its condition number.
+
+The raw design ``[1, X]`` equals ``A K`` with ``K = [[1, m], [0, I]]``, so
+the covariance of ``[intercept, slopes]`` is ``s² W Wᵀ`` with
+``W = K⁻¹ R⁻¹``, and the condition number statsmodels reports, that of the
+raw Gram matrix ``Kᵀ G K``, equals that of ``R K``: the ratio of its
+extreme singular values (statsmodels' ``condition_number`` is the square
+root of the Gram matrix's eigenvalue ratio).
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .batch import simple_ols_batch
+from .datasets import PROBLEMS_DIR, load_model_data, load_problems
+from .design import information_criteria
+from .ols import OLSFit
+
+
+def _upper_inverse(R):
+    """Inverses of a stack of upper-triangular matrices by back substitution.
+
+    One row of every inverse per step, vectorised over the stack.
+    """
+    m, k, _ = R.shape
+    eye = np.eye(k)
+    R_inv = np.zeros_like(R)
+    for i in range(k - 1, -1, -1):
+        rest = np.einsum("mj,mjc->mc", R[:, i, i + 1 :], R_inv[:, i + 1 :, :])
+        R_inv[:, i, :] = (eye[i] - rest) / R[:, i, i, None]
+    return R_inv
+
+
+def batch_inference(R, coef_c, sse, tss, n, x_mean, y_mean, terms, models, alpha=0.05):
+    """Coefficient and model tables for a stack of m fits with k parameters.
+
+    ``R`` is (m, k, k), the upper Cholesky factors of the centred Gram
+    matrices, ``coef_c`` (m, k) the coefficients on the centred
+    design, ``x_mean`` (m, k - 1); ``sse``, ``tss``, ``n`` and ``y_mean`` are
+    length m. ``terms`` names the k coefficients (intercept first) and
+    ``models`` the m fits. Returns ``(coef_table, model_table)``, the first in
+    long form with one row per (model, term).
+    """
+    R = np.asarray(R, dtype=np.float64)
+    m, k, _ = R.shape
+    n = np.asarray(n, dtype=np.float64)
+    sse = np.asarray(sse, dtype=np.float64)
+    tss = np.asarray(tss, dtype=np.float64)
+    df_model = k - 1
+    df_resid = n - k
+
+    K_inv = np.broadcast_to(np.eye(k), (m, k, k)).copy()
+    K_inv[:, 0, 1:] = -x_mean
+    coef = np.einsum("mij,mj->mi", K_inv, coef_c)
+    coef[:, 0] += y_mean
+    sigma2 = sse / df_resid
+    W = K_inv @ _upper_inverse(R)
+    se = np.sqrt(sigma2[:, None] * np.einsum("mij,mij->mi", W, W))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = coef / se
+    p = 2.0 * stats.t.sf(np.abs(t), df_resid[:, None])
+    half = stats.t.ppf(1.0 - alpha / 2.0, df_resid)[:, None] * se
+
+    K = np.broadcast_to(np.eye(k), (m, k, k)).copy()
+    K[:, 0, 1:] = x_mean
+    sv = np.linalg.svd(R @ K, compute_uv=False)
+    cond = sv[:, 0] / sv[:, -1]
+
+    r2 = 1.0 - sse / tss
+    with np.errstate(divide="ignore"):
+        f_stat = ((tss - sse) / df_model) / sigma2
+    aic, bic = information_criteria(sse, n, k)
+
+    coef_table = pd.DataFrame(
+        {
+            "model": np.repeat(models, k),
+            "term": np.tile(terms, m) if np.ndim(terms) == 1 else np.ravel(terms),
+            "coef": coef.ravel(),
+            "std_err": se.ravel(),
+            "t": t.ravel(),
+            "p_value": p.ravel(),
+            "ci_low": (coef - half).ravel(),
+            "ci_high": (coef + half).ravel(),
+        }
+    )
+    model_table = pd.DataFrame(
+        {
+            "model": models,
+            "n": n.astype(np.int64),
+            "df_model": df_model,
+            "df_resid": df_resid.astype(np.int64),
+            "r2": r2,
+            "adj_r2": 1.0 - (1.0 - r2) * (n - 1) / df_resid,
+            "f_stat": f_stat,
+            "f_pvalue": stats.f.sf(f_stat, df_model, df_resid),
+            "aic": aic,
+            "bic": bic,
+            "cond_no": cond,
+        }
+    )
+    return coef_table, model_table
+
+
+def ols_summary(X, y, feature_names=None, alpha=0.05, fit=None, name="model"):
+    """Tables for one ``y ~ 1 + X`` fit, reusing ``fit`` if already computed."""
+    fit = fit or OLSFit.fit(X, y)
+    p = len(fit.coef_c) - 1
+    terms = ["const"] + list(feature_names or [f"x{j + 1}" for j in range(p)])
+    return batch_inference(
+        fit.R[None],
+        fit.coef_c[None],
+        [fit.sse],
+        [fit.tss],
+        [fit.n],
+        np.atleast_1d(fit.x_mean)[None],
+        [fit.y_mean],
+        terms,
+        [name],
+        alpha,
+    )
+
+
+def problems_inference(data_dir=PROBLEMS_DIR, alpha=0.05):
+    """Inference tables for all single-feature students/03 problems at once."""
+    problems = load_problems(data_dir)
+    n = problems["n"]
+    fit = simple_ols_batch(problems["x"], problems["y"], n)
+
+    # One centred feature: G = diag(n, sxx), so R = diag(sqrt(n), sqrt(sxx)).
+    R = np.zeros((len(n), 2, 2))
+    R[:, 0, 0] = np.sqrt(n)
+    R[:, 1, 1] = np.sqrt(fit["sxx"])
+    coef_c = np.column_stack([np.zeros(len(n)), fit["slope"]])
+    terms = [["const", feature] for feature in problems["features"]]
+    return batch_inference(
+        R,
+        coef_c,
+        fit["sse"],
+        fit["syy"],
+        n,
+        fit["x_mean"][:, None],
+        fit["y_mean"],
+        terms,
+        problems["names"],
+        alpha,
+    )
+
+
+def model_inference(name, alpha=0.05):
+    X, y, features = load_model_data(name)
+    return ols_summary(X, y, features, alpha, name=name)
+
+
+def format_summary(coef_table, model_table):
+    """Plain-text block per model, in the spirit of statsmodels' summary()."""
+    blocks = []
+    for _, row in model_table.iterrows():
+        head = (
+            f"{row.model}: n = {row.n}, R² = {row.r2:.4f}, "
+            f"adj. R² = {row.adj_r2:.4f}, F = {row.f_stat:.4g} "
+            f"(p = {row.f_pvalue:.3g}), AIC = {row.aic:.2f}, BIC = {row.bic:.2f}, "
+            f"cond. no. = {row.cond_no:.3g}"
+        )
+        coefs = coef_table[coef_table.model == row.model].drop(columns="model")
+        blocks.append(head + "\n" + coefs.to_string(index=False))
+    return "\n\n".join(blocks)
@@ -0,0 +1,72 @@
+"""Confidence and prediction bands for many query rows at once.
+
+For a query row x (with intercept) the standard error of the fitted mean
+is ``s * sqrt(h)`` with ``h = x^T (X^T X)^{-1} x``, and that of a new
+observation is ``s * sqrt(1 + h)``. ``OLSFit.leverage`` already evaluates
+``h`` with one triangular solve against the cached Cholesky factor per
+block of rows, so the bands cost a matrix product and a solve per block;
+no per-point loop and no n x p inverse products are involved.
+
+The columns follow statsmodels' ``get_prediction().summary_frame()``.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .datasets import load_model_data
+from .design import as_2d
+from .ols import BLOCK_ROWS, OLSFit
+
+COLUMNS = [
+    "mean",
+    "mean_se",
+    "mean_ci_lower",
+    "mean_ci_upper",
+    "obs_ci_lower",
+    "obs_ci_upper",
+]
+
+
+def prediction_bands(fit, X, alpha=0.05, block_rows=BLOCK_ROWS, out=None):
+    """(n, 6) array of :data:`COLUMNS` for every row of ``X``.
+
+    ``out`` may be a preallocated (n, 6) array or ``np.memmap``; rows are
+    processed ``block_rows`` at a time, so only one block of the design and
+    its triangular solve is held in memory.
+    """
+    X = as_2d(X)
+    n = len(X)
+    out = np.empty((n, len(COLUMNS))) if out is None else out
+    t = stats.t.ppf(1.0 - alpha / 2.0, fit.df_resid)
+    s2 = fit.sigma2
+    for start in range(0, n, block_rows):
+        block = X[start : start + block_rows]
+        h = fit.leverage(block, block_rows=len(block))
+        mean = fit.predict(block)
+        mean_se = np.sqrt(s2 * h)
+        obs_half = t * np.sqrt(s2 * (1.0 + h))
+        rows = out[start : start + len(block)]
+        rows[:, 0] = mean
+        rows[:, 1] = mean_se
+        rows[:, 2] = mean - t * mean_se
+        rows[:, 3] = mean + t * mean_se
+        rows[:, 4] = mean - obs_half
+        rows[:, 5] = mean + obs_half
+    return out
+
+
+def prediction_frame(fit, X, alpha=0.05, block_rows=BLOCK_ROWS):
+    """:func:`prediction_bands` as a DataFrame (index follows ``X`` if it has one)."""
+    index = X.index if hasattr(X, "index") else None
+    return pd.DataFrame(
+        prediction_bands(fit, X, alpha, block_rows), columns=COLUMNS, index=index
+    )
+
+
+def model_intervals(name, X_query, alpha=0.05):
+    """Bands for query rows under one of the lab models in ``MODELS``."""
+    X, y, features = load_model_data(name)
+    fit = OLSFit.fit(X, y)
+    query = pd.DataFrame(as_2d(X_query), columns=features)
+    return pd.concat([query, prediction_frame(fit, query.to_numpy(), alpha)], axis=1)
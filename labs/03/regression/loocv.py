@@ -0,0 +1,71 @@
+"""Exact leave-one-out cross-validation via the PRESS identity.
+
+For OLS the leave-one-out residual of row i is ``e_i / (1 - h_i)``, where
+``e_i`` is the ordinary residual and ``h_i`` the leverage, so all n
+leave-one-out refits cost one fit plus the hat diagonal. For the
+single-feature students/03 problems ``h_i = 1/n + (x_i - mean x)^2 / Sxx``
+and the whole batch is evaluated in one pass.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .batch import simple_ols_batch
+from .datasets import PROBLEMS_DIR, load_model_data, load_problems
+from .design import as_2d
+from .ols import OLSFit
+
+
+def press(X, y, fit=None):
+    """Return (PRESS, leave-one-out residuals) for ``y ~ 1 + X``."""
+    X = as_2d(X)
+    y = np.asarray(y, dtype=np.float64)
+    fit = fit or OLSFit.fit(X, y)
+    loo = (y - fit.predict(X)) / (1.0 - fit.leverage(X))
+    return float(loo @ loo), loo
+
+
+def press_batch(x, y, n):
+    """PRESS of every single-feature problem in a zero-padded batch."""
+    fit = simple_ols_batch(x, y, n)
+    mask = np.arange(x.shape[1]) < n[:, None]
+    dx = x - fit["x_mean"][:, None]
+    h = 1.0 / n[:, None] + dx * dx / fit["sxx"][:, None]
+    e = y - (fit["intercept"][:, None] + fit["slope"][:, None] * x)
+    loo = np.where(mask, e / (1.0 - h), 0.0)
+    return (loo * loo).sum(axis=1), fit
+
+
+def loocv_table(data_dir=PROBLEMS_DIR, models=("marketing",)):
+    """LOOCV RMSE next to in-sample R² and RMSE for every dataset.
+
+    Covers the 30 students/03 problems plus the named lab models.
+    """
+    problems = load_problems(data_dir)
+    n = problems["n"]
+    press_values, fit = press_batch(problems["x"], problems["y"], n)
+    table = pd.DataFrame(
+        {
+            "dataset": problems["names"],
+            "n": n,
+            "r2": fit["r2"],
+            "rmse": fit["rmse"],
+            "loocv_rmse": np.sqrt(press_values / n),
+        }
+    )
+
+    rows = []
+    for name in models:
+        X, y, _ = load_model_data(name)
+        ols = OLSFit.fit(X, y)
+        value, _ = press(X, y, ols)
+        rows.append(
+            {
+                "dataset": name,
+                "n": ols.n,
+                "r2": ols.r2,
+                "rmse": np.sqrt(ols.sse / ols.n),
+                "loocv_rmse": np.sqrt(value / ols.n),
+            }
+        )
+    return pd.concat([table, pd.DataFrame(rows)], ignore_index=True)
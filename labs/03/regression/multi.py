@@ -0,0 +1,98 @@
+"""Many targets against one design matrix with a single factorisation.
+
+``X`` is centred and its Gram matrix is Cholesky-factored once; each block
+of target columns then costs one ``X^T Y_block`` product and two triangular
+solves. ``Y`` is processed in column blocks of ``block_cols`` so that only
+one block of centred targets and residual statistics is in memory at a
+time, however wide ``Y`` is.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import cho_solve
+
+from .datasets import load_model_data
+from .design import as_2d
+from .ols import gram_cholesky
+
+BLOCK_COLS = 1024
+
+
+class MultiTargetFit:
+    """Result of :func:`multi_target_ols`.
+
+    ``coef_`` is (p, k) like sklearn's multi-output ``coef_.T``;
+    ``intercept_``, ``r2`` and ``rmse`` have one entry per target.
+    """
+
+    def __init__(self, coef, intercept, r2, rmse, target_names=None):
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.r2 = r2
+        self.rmse = rmse
+        self.target_names = target_names
+
+    def predict(self, X, targets=None):
+        """Predict all targets, or only the columns in ``targets``."""
+        cols = slice(None) if targets is None else targets
+        return as_2d(X) @ self.coef_[:, cols] + self.intercept_[cols]
+
+    def summary(self, feature_names=None):
+        names = feature_names or [f"x{j}" for j in range(self.coef_.shape[0])]
+        table = pd.DataFrame(self.coef_.T, columns=names)
+        table.insert(0, "intercept", self.intercept_)
+        table["r2"] = self.r2
+        table["rmse"] = self.rmse
+        if self.target_names is not None:
+            table.index = self.target_names
+        return table
+
+
+def multi_target_ols(X, Y, block_cols=BLOCK_COLS, target_names=None):
+    """Solve ``Y[:, t] ~ 1 + X`` for every column t of ``Y`` at once.
+
+    ``Y`` may be any array-like supporting column slicing (a NumPy array, a
+    ``np.memmap`` of a file too big for RAM, or a DataFrame).
+    """
+    X = as_2d(X)
+    n, p = X.shape
+    if hasattr(Y, "columns") and target_names is None:
+        target_names = list(Y.columns)
+    if hasattr(Y, "to_numpy"):
+        Y = Y.to_numpy()
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    k = Y.shape[1]
+
+    x_mean = X.mean(axis=0)
+    Xc = X - x_mean
+    factor = (gram_cholesky(Xc.T @ Xc), False)
+
+    coef = np.empty((p, k))
+    intercept = np.empty(k)
+    r2 = np.empty(k)
+    rmse = np.empty(k)
+    for start in range(0, k, block_cols):
+        cols = slice(start, min(start + block_cols, k))
+        Yb = np.asarray(Y[:, cols], dtype=np.float64)
+        y_mean = Yb.mean(axis=0)
+        Yb = Yb - y_mean
+        XtY = Xc.T @ Yb
+        B = cho_solve(factor, XtY)
+        tss = np.einsum("ij,ij->j", Yb, Yb)
+        sse = np.maximum(tss - np.einsum("ij,ij->j", B, XtY), 0.0)
+        coef[:, cols] = B
+        intercept[cols] = y_mean - x_mean @ B
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2[cols] = 1.0 - sse / tss
+        rmse[cols] = np.sqrt(sse / n)
+    return MultiTargetFit(coef, intercept, r2, rmse, target_names)
+
+
+def marketing_multi_target(Y, block_cols=BLOCK_COLS, target_names=None):
+    """Regress every KPI column of the (200 x k) ``Y`` on TV, Radio and Newspaper.
+
+    ``Y`` has one row per marketing observation and one column per target.
+    """
+    X, _, _ = load_model_data("marketing")
+    return multi_target_ols(X, Y, block_cols=block_cols, target_names=target_names)
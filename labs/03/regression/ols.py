@@ -0,0 +1,186 @@
+"""OLS fit that keeps its Cholesky factor for later diagnostics.
+
+``OLSFit`` factors the Gram matrix of the centred design ``A = [1, X - m]``
+as ``A^T A = R^T R`` once. Anything that needs ``(X^T X)^{-1}`` afterwards,
+such as leverages ``h = ||R^{-T} a||^2``, reuses ``R`` through a triangular
+solve on blocks of rows, so the n x n hat matrix is never formed and memory
+stays O(block * p).
+
+``OLSFit.fit(X, y, dtype=np.float32)`` keeps the features in float32, which
+halves the bytes stored and read per pass. Each block of rows is upcast to
+float64 before it is centred and multiplied, so the Gram matrix is both
+formed and accumulated in float64; only one block is ever held in float64.
+``refine`` sweeps of iterative refinement then recompute the residuals in
+float64 and correct the coefficients with the same factor.
+
+``X`` may also be a scipy.sparse matrix (e.g. one-hot blocks from
+``regression.sparse``); the centred Gram matrix is then formed from the
+sparse product ``X^T X`` minus the rank-one mean correction, so the design
+is never densified beyond one block of rows.
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.linalg import cho_solve, solve_triangular
+
+from .design import as_2d, centered_design
+
+BLOCK_ROWS = 1 << 16
+RANK_TOL = 1e-7
+
+
+def gram_cholesky(G, offset=0):
+    """Upper Cholesky factor ``R`` of a centred Gram matrix, ``G = R^T R``.
+
+    Raises ValueError for a rank-deficient design. ``R_jj / sqrt(G_jj)`` is
+    the sine of the angle between column j and the span of the earlier
+    columns, so a value near 0 marks a collinear or constant column; the
+    message reports it as feature ``j - offset`` (``offset=1`` when column 0
+    is the intercept).
+    """
+    message = "design is rank deficient (collinear or constant columns)"
+    try:
+        R = np.linalg.cholesky(G).T
+    except np.linalg.LinAlgError:
+        raise ValueError(message) from None
+    bad = np.flatnonzero(np.diag(R) < RANK_TOL * np.sqrt(np.diag(G)))
+    if len(bad):
+        raise ValueError(f"{message}: feature column(s) {(bad - offset).tolist()}")
+    return R
+
+
+class OLSFit:
+    def __init__(self, x_mean, y_mean, R, coef_c, n, sse, tss):
+        self.x_mean = x_mean
+        self.y_mean = y_mean
+        self.R = R  # upper-triangular, A^T A = R^T R
+        self.coef_c = coef_c  # [c0, slopes] on the centred design
+        self.n = n
+        self.sse = sse
+        self.tss = tss
+
+    @classmethod
+    def fit(cls, X, y, dtype=np.float64, refine=2, block_rows=BLOCK_ROWS):
+        if sparse.issparse(X):
+            return cls._fit_sparse(X, y)
+        if np.dtype(dtype) == np.float32:
+            return cls._fit_float32(X, y, refine, block_rows)
+        A, yc, x_mean, y_mean = centered_design(X, y)
+        G = A.T @ A
+        b = A.T @ yc
+        return cls._from_normal_equations(G, b, yc @ yc, len(yc), x_mean, y_mean)
+
+    @classmethod
+    def from_accumulator(cls, stats):
+        """Build from a streaming ``GramAccumulator`` without revisiting the rows."""
+        p = stats.n_features
+        G = np.zeros((p + 1, p + 1))
+        G[0, 0] = stats.n
+        G[1:, 1:] = stats.comoment[:p, :p]
+        b = np.concatenate([[0.0], stats.comoment[:p, p]])
+        return cls._from_normal_equations(
+            G, b, stats.comoment[p, p], stats.n, stats.mean[:p], stats.mean[p]
+        )
+
+    @classmethod
+    def _fit_sparse(cls, X, y):
+        X = sparse.csr_matrix(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        n, p = X.shape
+        x_mean = np.asarray(X.sum(axis=0)).ravel() / n
+        y_mean = y.mean()
+        yc = y - y_mean
+        G = np.zeros((p + 1, p + 1))
+        G[0, 0] = n
+        G[1:, 1:] = (X.T @ X).toarray() - n * np.outer(x_mean, x_mean)
+        b = np.zeros(p + 1)
+        b[1:] = X.T @ yc  # yc sums to zero, so no mean correction is needed
+        return cls._from_normal_equations(G, b, yc @ yc, n, x_mean, y_mean)
+
+    @classmethod
+    def _fit_float32(cls, X, y, refine=2, block_rows=BLOCK_ROWS):
+        X = np.asarray(as_2d(X), dtype=np.float32)
+        y = np.asarray(y, dtype=np.float64)
+        n, p = X.shape
+        x_mean = X.mean(axis=0, dtype=np.float64)
+        y_mean = y.mean()
+        yc = y - y_mean
+        G = np.zeros((p + 1, p + 1))
+        b = np.zeros(p + 1)
+        G[0, 0] = n
+        for start in range(0, n, block_rows):
+            # Upcast the block before the product: float32 products would
+            # lose digits in D^T D before they ever reach the float64 sum.
+            D = X[start : start + block_rows].astype(np.float64) - x_mean
+            G[0, 1:] += D.sum(axis=0)
+            G[1:, 1:] += D.T @ D
+            b[1:] += D.T @ yc[start : start + block_rows]
+        G[1:, 0] = G[0, 1:]
+        tss = yc @ yc
+        fit = cls._from_normal_equations(G, b, tss, n, x_mean, y_mean)
+
+        for _ in range(refine):
+            g = np.zeros(p + 1)
+            rss = 0.0
+            for start in range(0, n, block_rows):
+                D = X[start : start + block_rows] - x_mean  # float64 block
+                r = yc[start : start + block_rows] - fit.coef_c[0] - D @ fit.coef_c[1:]
+                g[0] += r.sum()
+                g[1:] += D.T @ r
+                rss += r @ r
+            step = cho_solve((fit.R, False), g)
+            fit.coef_c = fit.coef_c + step
+            fit.sse = max(rss - step @ g, 0.0)
+        return fit
+
+    @classmethod
+    def _from_normal_equations(cls, G, b, tss, n, x_mean, y_mean):
+        R = gram_cholesky(G, offset=1)
+        coef_c = cho_solve((R, False), b)
+        sse = max(tss - coef_c @ b, 0.0)
+        return cls(x_mean, y_mean, R, coef_c, n, sse, tss)
+
+    @property
+    def n_params(self):
+        return len(self.coef_c)
+
+    @property
+    def df_resid(self):
+        return self.n - self.n_params
+
+    @property
+    def sigma2(self):
+        return self.sse / self.df_resid
+
+    @property
+    def coef_(self):
+        return self.coef_c[1:]
+
+    @property
+    def intercept_(self):
+        return self.y_mean + self.coef_c[0] - self.x_mean @ self.coef_c[1:]
+
+    @property
+    def r2(self):
+        return 1.0 - self.sse / self.tss
+
+    def design(self, X):
+        X = X.toarray() if sparse.issparse(X) else as_2d(X)
+        return np.column_stack([np.ones(len(X)), X - self.x_mean])
+
+    def predict(self, X):
+        X = sparse.csr_matrix(X) if sparse.issparse(X) else as_2d(X)
+        return X @ self.coef_ + self.intercept_
+
+    def leverage(self, X, block_rows=BLOCK_ROWS):
+        """``x_i^T (X^T X)^{-1} x_i`` for every row, one triangular solve per block.
+
+        For the training rows this is the diagonal of the hat matrix.
+        """
+        X = sparse.csr_matrix(X) if sparse.issparse(X) else as_2d(X)
+        h = np.empty(X.shape[0])
+        for start in range(0, X.shape[0], block_rows):
+            A = self.design(X[start : start + block_rows])
+            Z = solve_triangular(self.R, A.T, trans="T")
+            h[start : start + len(A)] = np.einsum("ij,ij->j", Z, Z)
+        return h
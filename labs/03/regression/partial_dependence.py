@@ -0,0 +1,155 @@
+"""Partial dependence and ICE curves for every feature in one evaluation.
+
+For a fitted model and data ``X`` (n x p) the ICE tensor has shape
+(p features, G grid points, n rows). Generic models get the whole tensor
+as a single stacked ``predict`` call. Linear regressors skip prediction:
+moving feature j from ``x_ij`` to ``v`` shifts the prediction by
+``coef_j * (v - x_ij)``. The shortcut is only taken when ``coef_`` is 1-D
+and ``predict`` on a few rows equals ``X @ coef_ + intercept_``, which
+rules out classifiers, GLMs with a non-identity link and multi-output
+models; those go through ``predict``.
+
+Results are cached on a hash of the model, the data and the grid settings,
+so redrawing plots in a marimo app does not recompute them.
+"""
+
+import hashlib
+import pickle
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+from .design import as_2d
+
+CACHE_SIZE = 32
+_cache = OrderedDict()
+
+
+class PartialDependence(NamedTuple):
+    features: list
+    grid: np.ndarray  # (p, G)
+    average: np.ndarray  # (p, G) partial dependence
+    ice: np.ndarray  # (p, G, n) individual conditional expectation, or None
+    # Multi-output models add a trailing output axis to ``average`` and ``ice``.
+
+
+def _predict(model, X, feature_names):
+    if hasattr(model, "feature_names_in_"):
+        import pandas as pd
+
+        X = pd.DataFrame(X, columns=feature_names)
+    return np.asarray(model.predict(X), dtype=np.float64)
+
+
+def _is_linear(model, X, feature_names):
+    """True for identity-link regressors whose ``predict`` is ``X @ coef_ + b``."""
+    if not (hasattr(model, "coef_") and hasattr(model, "intercept_")):
+        return False
+    if hasattr(model, "classes_") or np.ndim(model.coef_) != 1:
+        return False
+    if np.size(model.intercept_) != 1:
+        return False
+    rows = X[:3]
+    linear = rows @ np.asarray(model.coef_, dtype=np.float64)
+    linear = linear + float(np.ravel(model.intercept_)[0])
+    predicted = _predict(model, rows, feature_names)
+    return predicted.shape == linear.shape and np.allclose(predicted, linear)
+
+
+def model_hash(model):
+    """Content hash of a model: its type and coefficients, else its pickle."""
+    h = hashlib.sha1(type(model).__qualname__.encode())
+    if hasattr(model, "coef_") and hasattr(model, "intercept_"):
+        h.update(np.ascontiguousarray(model.coef_, dtype=np.float64).tobytes())
+        h.update(np.ascontiguousarray(model.intercept_, dtype=np.float64).tobytes())
+    else:
+        h.update(pickle.dumps(model))
+    return h.hexdigest()
+
+
+def _grids(X, grid_resolution, percentiles):
+    lo, hi = np.percentile(X, [100 * percentiles[0], 100 * percentiles[1]], axis=0)
+    steps = np.linspace(0.0, 1.0, grid_resolution)
+    return lo[:, None] + (hi - lo)[:, None] * steps
+
+
+def _linear_ice(model, X, grid):
+    coef = np.ravel(model.coef_)
+    base = X @ coef + float(np.ravel(model.intercept_)[0])
+    # (p, G, n): f(x_i) + coef_j * (v_jg - x_ij)
+    return base + coef[:, None, None] * (grid[:, :, None] - X.T[:, None, :])
+
+
+def _predicted_ice(model, X, grid, feature_names):
+    n, p = X.shape
+    G = grid.shape[1]
+    tensor = np.broadcast_to(X, (p, G, n, p)).copy()
+    for j in range(p):
+        tensor[j, :, :, j] = grid[j][:, None]
+    flat = tensor.reshape(p * G * n, p)
+    pred = _predict(model, flat, feature_names)
+    return pred.reshape((p, G, n) + pred.shape[1:])  # trailing axis per output
+
+
+def partial_dependence(
+    model,
+    X,
+    feature_names=None,
+    grid_resolution=100,
+    percentiles=(0.0, 1.0),
+    ice=True,
+    use_cache=True,
+):
+    """Partial dependence (and ICE) of ``model`` on every column of ``X``.
+
+    The grid for each feature spans the given percentiles of its values
+    (min..max by default, as in the exercise2 plots).
+    """
+    if hasattr(X, "columns") and feature_names is None:
+        feature_names = list(X.columns)
+    X = as_2d(X)
+    features = list(feature_names or [f"x{j}" for j in range(X.shape[1])])
+
+    key = None
+    if use_cache:
+        data_hash = hashlib.sha1(np.ascontiguousarray(X).tobytes()).hexdigest()
+        key = (
+            model_hash(model),
+            data_hash,
+            tuple(features),
+            grid_resolution,
+            tuple(percentiles),
+            ice,
+        )
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    grid = _grids(X, grid_resolution, percentiles)
+    if _is_linear(model, X, features):
+        if ice:
+            curves = _linear_ice(model, X, grid)
+            average = curves.mean(axis=2)
+        else:
+            # Averaging the ICE shift over rows only needs the column means.
+            coef = np.ravel(model.coef_)
+            mean_pred = X.mean(axis=0) @ coef + float(np.ravel(model.intercept_)[0])
+            average = mean_pred + coef[:, None] * (grid - X.mean(axis=0)[:, None])
+            curves = None
+    else:
+        curves = _predicted_ice(model, X, grid, features)
+        average = curves.mean(axis=2)
+        if not ice:
+            curves = None
+
+    result = PartialDependence(features, grid, average, curves)
+    if key is not None:
+        _cache[key] = result
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def clear_cache():
+    _cache.clear()
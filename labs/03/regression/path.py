@@ -0,0 +1,140 @@
+"""Regularization paths: ridge from one SVD, lasso / elastic net by warm starts.
+
+Penalties follow sklearn so the numbers can be checked against ``Ridge``,
+``Lasso`` and ``ElasticNet``; the intercept is never penalised (X and y are
+centred first).
+
+- Ridge minimises ``||y - Xw||^2 + alpha ||w||^2``. With ``X = U S V^T``
+  computed once, ``w(alpha) = V diag(s / (s^2 + alpha)) U^T y`` for the whole
+  grid is one broadcast, and RSS and the GCV score come from the same
+  factors.
+- Lasso / elastic net minimise
+  ``1/(2n) ||y - Xw||^2 + alpha * l1_ratio ||w||_1
+  + alpha * (1 - l1_ratio) / 2 ||w||^2`` by coordinate descent on the Gram
+  matrix, walking the grid from large to small alpha and starting each
+  solve from the previous solution.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .datasets import load_model_data
+from .design import centered_design
+
+
+class RegularizationPath(NamedTuple):
+    alphas: np.ndarray  # (A,)
+    coefs: np.ndarray  # (A, p)
+    intercepts: np.ndarray  # (A,)
+    rss: np.ndarray  # (A,)
+    r2: np.ndarray  # (A,)
+    extra: dict  # "df" and "gcv" for ridge, "n_iter" for coordinate descent
+
+
+def ridge_path(X, y, alphas):
+    """Ridge coefficients for every alpha from a single thin SVD of X."""
+    A, yc, x_mean, y_mean = centered_design(X, y)
+    Xc = A[:, 1:]
+    alphas = np.asarray(alphas, dtype=np.float64)
+    n = len(yc)
+
+    U, s, Vt = np.linalg.svd(Xc, full_matrices=False)
+    Uty = U.T @ yc
+    s2 = s * s
+    denom = s2[None, :] + alphas[:, None]  # (A, r)
+    # Zero singular values (constant or collinear columns) get no weight,
+    # which is the minimum-norm solution when alpha is 0 too.
+    ok = denom > 0
+    shrink = np.divide(s2, denom, out=np.zeros_like(denom), where=ok)
+    coefs = (np.divide(s, denom, out=np.zeros_like(denom), where=ok) * Uty) @ Vt
+    tss = yc @ yc
+    # Residual = part of y outside span(U) + the shrunk-away part inside it.
+    rss = (tss - Uty @ Uty) + (((1 - shrink) * Uty) ** 2).sum(axis=1)
+    df = shrink.sum(axis=1)
+    gcv = n * rss / (n - df) ** 2
+    return RegularizationPath(
+        alphas,
+        coefs,
+        y_mean - coefs @ x_mean,
+        rss,
+        1 - rss / tss,
+        {"df": df, "gcv": gcv},
+    )
+
+
+def default_alphas(X, y, l1_ratio=1.0, n_alphas=100, eps=1e-3):
+    """sklearn's grid: geometric from the smallest all-zero alpha down by ``eps``."""
+    A, yc, _, _ = centered_design(X, y)
+    Xc = A[:, 1:]
+    alpha_max = np.abs(Xc.T @ yc).max() / (len(yc) * max(l1_ratio, 1e-3))
+    return np.geomspace(alpha_max, alpha_max * eps, n_alphas)
+
+
+def enet_path(X, y, alphas=None, l1_ratio=1.0, tol=1e-4, max_iter=1000):
+    """Elastic-net path by warm-started coordinate descent (``l1_ratio=1`` is lasso)."""
+    A, yc, x_mean, y_mean = centered_design(X, y)
+    Xc = A[:, 1:]
+    n, p = Xc.shape
+    if alphas is None:
+        alphas = default_alphas(X, y, l1_ratio)
+    alphas = np.sort(np.asarray(alphas, dtype=np.float64))[::-1]
+
+    G = Xc.T @ Xc / n
+    c = Xc.T @ yc / n
+    diag = np.diag(G).copy()
+    tss = yc @ yc
+
+    w = np.zeros(p)
+    grad = c.copy()  # c - G w, kept up to date as w changes
+    coefs = np.empty((len(alphas), p))
+    n_iter = np.empty(len(alphas), dtype=int)
+    for a, alpha in enumerate(alphas):
+        l1 = alpha * l1_ratio
+        l2 = alpha * (1 - l1_ratio)
+        # Stop once the largest coordinate move is small relative to the
+        # largest coefficient.
+        for it in range(1, max_iter + 1):
+            max_step = 0.0
+            for j in range(p):
+                if diag[j] == 0.0:
+                    continue
+                rho = grad[j] + diag[j] * w[j]
+                new = np.sign(rho) * max(abs(rho) - l1, 0.0) / (diag[j] + l2)
+                step = new - w[j]
+                if step != 0.0:
+                    grad -= G[:, j] * step
+                    w[j] = new
+                    max_step = max(max_step, abs(step))
+            if max_step <= tol * max(np.abs(w).max(), 1e-12):
+                break
+        coefs[a] = w
+        n_iter[a] = it
+
+    rss = tss - 2 * coefs @ (c * n) + np.einsum("ap,pq,aq->a", coefs, G * n, coefs)
+    return RegularizationPath(
+        alphas, coefs, y_mean - coefs @ x_mean, rss, 1 - rss / tss, {"n_iter": n_iter}
+    )
+
+
+def lasso_path(X, y, alphas=None, tol=1e-4, max_iter=1000):
+    return enet_path(X, y, alphas, l1_ratio=1.0, tol=tol, max_iter=max_iter)
+
+
+def path_model(name="marketing", kind="ridge", alphas=None, l1_ratio=0.5):
+    """Regularization path for a lab model: ``marketing``, ``salaries`` or ``co2``.
+
+    ``kind`` is ``"ridge"``, ``"lasso"`` or ``"enet"``. Ridge defaults to 100
+    alphas from 1e-3 to 1e5; lasso / elastic net use :func:`default_alphas`.
+    Returns the path and the feature names.
+    """
+    X, y, features = load_model_data(name)
+    if kind == "ridge":
+        if alphas is None:
+            alphas = np.geomspace(1e-3, 1e5, 100)
+        return ridge_path(X, y, alphas), features
+    if kind == "lasso":
+        return lasso_path(X, y, alphas), features
+    if kind == "enet":
+        return enet_path(X, y, alphas, l1_ratio=l1_ratio), features
+    raise ValueError(f"unknown kind {kind!r}")
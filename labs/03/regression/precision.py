@@ -0,0 +1,67 @@
+"""Accuracy report for the float32 / mixed-precision OLS mode.
+
+``precision_report`` fits the same data in float64 and with float32 feature
+storage (``OLSFit.fit(..., dtype=np.float32)``) at several refinement
+counts, and tabulates time, feature memory and the coefficient error
+against the float64 solution.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from .datasets import MARKETING_FEATURES, load_model_data
+from .design import as_2d
+from .ols import OLSFit
+
+
+def precision_report(X, y, feature_names=None, refine=(0, 1, 2)):
+    X = as_2d(X)
+    y = np.asarray(y, dtype=np.float64)
+    names = feature_names or [f"x{j}" for j in range(X.shape[1])]
+    X32 = X.astype(np.float32)
+
+    runs = [("float64", X, lambda: OLSFit.fit(X, y))]
+    for k in refine:
+        runs.append(
+            (
+                f"float32+{k} refine",
+                X32,
+                lambda k=k: OLSFit.fit(X32, y, dtype=np.float32, refine=k),
+            )
+        )
+
+    rows = []
+    for mode, data, func in runs:
+        start = time.perf_counter()
+        fit = func()
+        seconds = time.perf_counter() - start
+        row = {"mode": mode, "seconds": seconds, "feature_mb": data.nbytes / 2**20}
+        row["intercept"] = fit.intercept_
+        row.update(zip(names, fit.coef_))
+        row["r2"] = fit.r2
+        rows.append(row)
+
+    table = pd.DataFrame(rows)
+    coefs = table[["intercept"] + names].to_numpy()
+    diff = np.abs(coefs - coefs[0])
+    table["max_abs_diff"] = diff.max(axis=1)
+    table["max_rel_diff"] = (diff / np.maximum(np.abs(coefs[0]), 1e-300)).max(axis=1)
+    table["r2_diff"] = table.r2 - table.r2.iloc[0]
+    return table
+
+
+def precision_model(name="marketing", refine=(0, 1, 2)):
+    X, y, features = load_model_data(name)
+    return precision_report(X, y, features, refine)
+
+
+def precision_synthetic(n_rows=10**7, collinearity=0.0, refine=(0, 1, 2), seed=0):
+    """Report on a marketing-shaped table of ``n_rows`` synthetic rows."""
+    from .synthetic import marketing_chunk
+
+    X, y = marketing_chunk(
+        np.random.default_rng(seed), n_rows, collinearity=collinearity
+    )
+    return precision_report(X, y, MARKETING_FEATURES, refine)
@@ -0,0 +1,228 @@
+"""On-disk registry of fitted linear models.
+
+Each artifact is two files in ``<root>/<name>/``:
+
+- ``v<version>.npy`` – one flat float64 vector
+  ``[intercept, coef..., scaler_mean..., scaler_scale...]`` saved with
+  ``np.save``, so it can be memory-mapped with ``np.load(mmap_mode="r")``;
+- ``v<version>.json`` – feature names, the vector layout and the SHA-256 of
+  the ``.npy`` file.
+
+Apps load the artifact instead of refitting at startup. ``pins.json`` in
+the root maps a model name to the version ``load`` returns by default.
+
+The default root is ``labs/03/models`` (ignored by git); set
+``REGRESSION_MODELS_DIR`` to keep artifacts elsewhere.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .datasets import REPO_ROOT
+
+DEFAULT_ROOT = Path(
+    os.environ.get("REGRESSION_MODELS_DIR", REPO_ROOT / "labs" / "03" / "models")
+)
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ModelArtifact:
+    """A saved model whose parameter vector is memory-mapped on first use."""
+
+    def __init__(self, manifest, path, verify=False):
+        self.manifest = manifest
+        self.path = Path(path)
+        self.verify = verify
+        self._values = None
+
+    name = property(lambda self: self.manifest["name"])
+    version = property(lambda self: self.manifest["version"])
+    feature_names = property(lambda self: self.manifest["feature_names"])
+    sha256 = property(lambda self: self.manifest["sha256"])
+
+    @property
+    def values(self):
+        if self._values is None:
+            if self.verify and _sha256(self.path) != self.sha256:
+                raise ValueError(f"{self.path} does not match its manifest hash")
+            self._values = np.load(self.path, mmap_mode="r")
+        return self._values
+
+    def _slice(self, key):
+        start, stop = self.manifest["layout"][key]
+        return self.values[start:stop] if stop > start else None
+
+    @property
+    def intercept(self):
+        return float(self.values[0])
+
+    @property
+    def coef(self):
+        return self._slice("coef")
+
+    @property
+    def scaler_mean(self):
+        return self._slice("scaler_mean")
+
+    @property
+    def scaler_scale(self):
+        return self._slice("scaler_scale")
+
+    # sklearn-style aliases so the artifact can stand in for a fitted model.
+    coef_ = coef
+    intercept_ = intercept
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if self.scaler_mean is not None:
+            X = (X - self.scaler_mean) / self.scaler_scale
+        return X @ self.coef + self.intercept
+
+    def __repr__(self):
+        return f"ModelArtifact({self.name!r}, version={self.version})"
+
+
+class ModelRegistry:
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = Path(root)
+
+    def _versions(self, name):
+        return sorted(int(p.stem[1:]) for p in (self.root / name).glob("v*.json"))
+
+    def _pins(self):
+        path = self.root / "pins.json"
+        return json.loads(path.read_text()) if path.exists() else {}
+
+    def save(self, name, model, feature_names=None, scaler=None):
+        """Save ``model`` (``coef_`` / ``intercept_``) as the next version of ``name``.
+
+        ``scaler`` may be a fitted StandardScaler (``mean_`` / ``scale_``); it is
+        stored alongside and applied by ``ModelArtifact.predict``.
+        """
+        coef = np.ravel(np.asarray(model.coef_, dtype=np.float64))
+        intercept = float(np.ravel(model.intercept_)[0])
+        if feature_names is None:
+            feature_names = getattr(model, "feature_names_in_", None)
+        if feature_names is None:
+            feature_names = getattr(model, "feature_names", None)
+        if feature_names is None:
+            feature_names = [f"x{j}" for j in range(len(coef))]
+        feature_names = [str(f) for f in feature_names]
+
+        parts = [np.array([intercept]), coef]
+        if scaler is not None:
+            parts += [np.ravel(scaler.mean_), np.ravel(scaler.scale_)]
+        values = np.concatenate(parts).astype(np.float64)
+        p = len(coef)
+        layout = {
+            "intercept": [0, 1],
+            "coef": [1, 1 + p],
+            "scaler_mean": [1 + p, 1 + 2 * p] if scaler is not None else [0, 0],
+            "scaler_scale": [1 + 2 * p, 1 + 3 * p] if scaler is not None else [0, 0],
+        }
+
+        folder = self.root / name
+        folder.mkdir(parents=True, exist_ok=True)
+        versions = self._versions(name)
+        version = versions[-1] + 1 if versions else 1
+        npy = folder / f"v{version}.npy"
+        np.save(npy, values)
+        manifest = {
+            "name": name,
+            "version": version,
+            "feature_names": feature_names,
+            "layout": layout,
+            "sha256": _sha256(npy),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        (folder / f"v{version}.json").write_text(json.dumps(manifest, indent=2))
+        return version
+
+    def load(self, name, version=None, verify=False):
+        """Return a lazily memory-mapped artifact.
+
+        ``version=None`` uses the pinned version if there is one, else the
+        latest. ``verify=True`` checks the SHA-256 before the first read.
+        """
+        if version is None:
+            version = self._pins().get(name)
+        if version is None:
+            versions = self._versions(name)
+            if not versions:
+                raise FileNotFoundError(f"no saved versions of {name!r} in {self.root}")
+            version = versions[-1]
+        folder = self.root / name
+        manifest_path = folder / f"v{version}.json"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"{name!r} has no version {version}")
+        manifest = json.loads(manifest_path.read_text())
+        return ModelArtifact(manifest, folder / f"v{version}.npy", verify=verify)
+
+    def pin(self, name, version):
+        if version not in self._versions(name):
+            raise FileNotFoundError(f"{name!r} has no version {version}")
+        pins = self._pins()
+        pins[name] = version
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / "pins.json").write_text(json.dumps(pins, indent=2))
+
+    def unpin(self, name):
+        pins = self._pins()
+        if pins.pop(name, None) is not None:
+            (self.root / "pins.json").write_text(json.dumps(pins, indent=2))
+
+    def list(self):
+        """One row per saved artifact."""
+        pins = self._pins()
+        rows = []
+        manifests = self.root.glob("*/v*.json")
+        # Sort by integer version so v10 follows v9 rather than v1.
+        for manifest_path in sorted(
+            manifests, key=lambda p: (p.parent.name, int(p.stem[1:]))
+        ):
+            m = json.loads(manifest_path.read_text())
+            rows.append(
+                {
+                    "name": m["name"],
+                    "version": m["version"],
+                    "pinned": pins.get(m["name"]) == m["version"],
+                    "features": ",".join(m["feature_names"]),
+                    "scaled": m["layout"]["scaler_mean"][1] > 0,
+                    "sha256": m["sha256"][:12],
+                    "created": m["created"],
+                }
+            )
+        columns = [
+            "name",
+            "version",
+            "pinned",
+            "features",
+            "scaled",
+            "sha256",
+            "created",
+        ]
+        return pd.DataFrame(rows, columns=columns)
+
+    def load_or_fit(self, name, fit, verify=False, **save_kwargs):
+        """Load ``name`` if any version exists, else call ``fit()`` and save it.
+
+        ``fit`` returns a fitted model; this is what a dashboard app calls at
+        startup so that only the first run pays for a fit. ``verify`` is
+        passed on to ``load``.
+        """
+        if not self._versions(name):
+            self.save(name, fit(), **save_kwargs)
+        return self.load(name, verify=verify)
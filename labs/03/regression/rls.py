@@ -0,0 +1,142 @@
+"""Recursive least squares: O(p^2) coefficient updates per observation.
+
+``RecursiveLeastSquares`` exposes ``coef_`` / ``intercept_`` like the
+LinearRegression in lab03b.py, but absorbs new rows one at a time instead of
+refitting. The number of features is taken from the first ``fit`` /
+``update``. With a forgetting factor ``lam < 1`` old observations decay by
+``lam`` per step, so the model tracks drift in a continuous feed.
+
+The recursion on the inverse Gram matrix ``P`` slowly loses symmetry and
+positive definiteness in floating point. Alongside it the upper-triangular
+square root ``R`` of the exponentially weighted Gram matrix (``G = R^T R``)
+and the rotated targets ``z`` are kept up to date with Givens rotations,
+also O(p^2) per row. Rotations are orthogonal, so ``R`` stays accurate
+without ever forming ``G``, and every ``refresh_every`` updates ``P`` and the
+coefficients are recomputed from it by triangular solves, resetting the
+accumulated error.
+"""
+
+import numpy as np
+from scipy.linalg import solve_triangular
+
+from .design import as_2d
+from .ols import RANK_TOL
+
+
+class RecursiveLeastSquares:
+    def __init__(self, lam=1.0, delta=1e6, refresh_every=1000):
+        if not 0.0 < lam <= 1.0:
+            raise ValueError("lam must be in (0, 1]")
+        self.lam = lam
+        self.delta = delta
+        self.refresh_every = refresh_every
+        self.w = None
+        self.n_seen_ = 0
+
+    def _start(self, n_features):
+        q = n_features + 1
+        self.w = np.zeros(q)
+        self.P = np.eye(q) * self.delta
+        # P = inv(R^T R) exactly; R starts as the square root of the prior.
+        self.R = np.eye(q) / np.sqrt(self.delta)
+        self.z = np.zeros(q)
+        self.n_seen_ = 0
+
+    @property
+    def coef_(self):
+        return self.w[1:]
+
+    @property
+    def intercept_(self):
+        return self.w[0]
+
+    def update(self, x, y):
+        """Absorb one observation; returns the a-priori prediction error."""
+        x = np.ravel(np.asarray(x, dtype=np.float64))
+        if self.w is None:
+            self._start(len(x))
+        a = np.empty(len(self.w))
+        a[0] = 1.0
+        a[1:] = x
+        Pa = self.P @ a
+        k = Pa / (self.lam + a @ Pa)
+        err = y - self.w @ a
+        self.w += k * err
+        self.P -= np.outer(k, Pa)
+        self.P /= self.lam
+        self._rotate_in(a, y)
+        self.n_seen_ += 1
+        if self.refresh_every and self.n_seen_ % self.refresh_every == 0:
+            self.refresh()
+        return err
+
+    def _rotate_in(self, a, y):
+        """Decay ``R`` and ``z`` by ``lam`` and rotate the row ``[a, y]`` in."""
+        R, z = self.R, self.z
+        root = np.sqrt(self.lam)
+        R *= root
+        z *= root
+        a = a.copy()
+        for i in range(len(a)):
+            if a[i] == 0.0:
+                continue
+            r = np.hypot(R[i, i], a[i])
+            c, s = R[i, i] / r, a[i] / r
+            row = R[i, i:].copy()
+            R[i, i:] = c * row + s * a[i:]
+            a[i:] = c * a[i:] - s * row
+            z[i], y = c * z[i] + s * y, c * y - s * z[i]
+
+    def partial_fit(self, X, y):
+        """Absorb rows in order (one RLS update per row)."""
+        X = as_2d(X)
+        for x_i, y_i in zip(X, np.asarray(y, dtype=np.float64)):
+            self.update(x_i, y_i)
+        return self
+
+    def fit(self, X, y):
+        """Initialise exactly from a batch, then continue with ``update``.
+
+        Rows are weighted as if they had arrived in order under forgetting.
+        """
+        X = as_2d(X)
+        y = np.asarray(y, dtype=np.float64)
+        self._start(X.shape[1])
+        A = np.column_stack([np.ones(len(X)), X])
+        root = np.sqrt(self.lam ** np.arange(len(X) - 1, -1, -1.0))
+        q = A.shape[1]
+        # One QR of the decayed prior stacked on the weighted rows gives the
+        # same R and z as rotating the rows in one at a time.
+        prior = np.eye(q) * np.sqrt(self.lam ** len(X) / self.delta)
+        Q, R = np.linalg.qr(np.vstack([prior, A * root[:, None]]))
+        self.z = Q.T @ np.r_[np.zeros(q), y * root]
+        # Match the positive diagonal that the Givens updates keep.
+        sign = np.where(np.diag(R) < 0, -1.0, 1.0)
+        self.R = R * sign[:, None]
+        self.z *= sign
+        self.n_seen_ = len(X)
+        self.refresh()
+        return self
+
+    def refresh(self):
+        """Recompute ``P`` and the coefficients from the square-root factor.
+
+        Raises ValueError when ``R`` is numerically singular, which happens
+        once forgetting has decayed the prior on a stream where a feature is
+        constant or collinear with the others.
+        """
+        R = self.R
+        # Same test as ols.gram_cholesky: R_jj over the norm of column j.
+        bad = np.flatnonzero(np.abs(np.diag(R)) < RANK_TOL * np.linalg.norm(R, axis=0))
+        if len(bad):
+            raise ValueError(
+                "recent observations are rank deficient (collinear or constant "
+                f"columns): feature column(s) {(bad - 1).tolist()}"
+            )
+        R_inv = solve_triangular(R, np.eye(len(R)))
+        self.P = R_inv @ R_inv.T
+        self.w = R_inv @ self.z
+        return self
+
+    def predict(self, X):
+        return as_2d(X) @ self.coef_ + self.intercept_
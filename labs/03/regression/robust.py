@@ -0,0 +1,212 @@
+"""Robust regression for many series at once: Huber / Tukey IRLS and RANSAC.
+
+Series are stacked in a zero-padded batch: ``X`` is (m, n_max, p) (or
+(m, n_max) for one feature), ``y`` is (m, n_max) and ``n`` gives the real
+length of each series. Every IRLS step forms all m weighted normal
+equations of the centred design with one ``einsum`` and solves them with
+one batched ``np.linalg.solve``; RANSAC draws the minimal samples of every series as a
+single (m, trials, p + 1) index array.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .batch import simple_ols_batch
+from .datasets import PROBLEMS_DIR, load_model_data, load_problems
+
+HUBER_C = 1.345
+TUKEY_C = 4.685
+BLOCK_ELEMENTS = 1_000_000
+
+
+def _batch(X, y, n):
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 2:
+        X = X[:, :, None]
+    y = np.asarray(y, dtype=np.float64)
+    m, n_max, _ = X.shape
+    n = np.full(m, n_max) if n is None else np.asarray(n)
+    mask = np.arange(n_max) < n[:, None]
+    A = np.concatenate([np.ones((m, n_max, 1)), X], axis=2) * mask[:, :, None]
+    return A, np.where(mask, y, 0.0), mask, n
+
+
+def _weighted_solve(A, y, w):
+    """Solve every series' weighted least-squares problem in one call.
+
+    The slopes are solved on the design centred at its weighted mean, so the
+    intercept is never part of the linear system and a large offset in x
+    cannot affect it. Degenerate series (all weight on one x value, or
+    collinear features) get the minimum-norm solution from ``pinv``.
+    """
+    X = A[:, :, 1:]
+    sw = np.maximum(w.sum(axis=1), 1e-300)
+    x_mean = np.einsum("mni,mn->mi", X, w) / sw[:, None]
+    y_mean = np.einsum("mn,mn->m", w, y) / sw
+    Xc = (X - x_mean[:, None, :]) * (w > 0)[:, :, None]
+    Xw = Xc * w[:, :, None]
+    G = Xw.transpose(0, 2, 1) @ Xc
+    b = np.einsum("mni,mn->mi", Xw, y - y_mean[:, None])
+
+    # A centred column that is only rounding error of the raw one is constant
+    # under these weights; otherwise test the scale-free (correlation) matrix.
+    d = np.sqrt(np.einsum("mii->mi", G))
+    raw = np.sqrt(np.einsum("mni,mn,mni->mi", X, w, X))
+    flat = d <= 1e-8 * raw
+    d = np.where(flat, 1.0, d)
+    degenerate = flat.any(axis=1) | (
+        np.linalg.det(G / (d[:, :, None] * d[:, None, :])) < 1e-12
+    )
+    G = np.where(flat[:, :, None] | flat[:, None, :], 0.0, G)
+    b = np.where(flat, 0.0, b)
+
+    slopes = np.empty_like(b)
+    ok = ~degenerate
+    slopes[ok] = np.linalg.solve(G[ok], b[ok][:, :, None])[:, :, 0]
+    if degenerate.any():
+        slopes[degenerate] = np.einsum(
+            "mij,mj->mi",
+            np.linalg.pinv(G[degenerate], hermitian=True),
+            b[degenerate],
+        )
+    intercept = y_mean - np.einsum("mi,mi->m", x_mean, slopes)
+    return np.column_stack([intercept, slopes])
+
+
+def _mad_scale(resid, mask, floor):
+    med = np.nanmedian(np.where(mask, resid, np.nan), axis=1, keepdims=True)
+    r = np.where(mask, np.abs(resid - med), np.nan)
+    return np.maximum(np.nanmedian(r, axis=1) / 0.6745, floor)
+
+
+def irls_batch(X, y, n=None, loss="huber", c=None, max_iter=50, tol=1e-6):
+    """M-estimation by iteratively reweighted least squares for every series.
+
+    ``loss`` is ``"huber"`` or ``"tukey"`` (bisquare). The residual scale is
+    re-estimated from the MAD at every step. Returns a dict with ``coef``
+    (m, p + 1; intercept first), ``scale``, ``weights`` and ``n_iter``.
+    """
+    if loss not in ("huber", "tukey"):
+        raise ValueError(f"unknown loss {loss!r}")
+    A, y, mask, n = _batch(X, y, n)
+    c = c or (HUBER_C if loss == "huber" else TUKEY_C)
+    w = mask.astype(np.float64)
+    if loss == "tukey":
+        # Bisquare is not convex; start it from the Huber solution.
+        coef = irls_batch(X, y, n, "huber", max_iter=max_iter, tol=tol)["coef"]
+    else:
+        coef = _weighted_solve(A, y, w)
+    # Exact fits have a MAD of ~0; measure residuals against the size of y.
+    floor = 1e-9 * np.maximum(np.abs(y).max(axis=1), 1e-300)
+
+    for it in range(1, max_iter + 1):
+        resid = y - np.einsum("mni,mi->mn", A, coef)
+        scale = _mad_scale(resid, mask, floor)
+        u = np.abs(resid) / (c * scale[:, None])
+        if loss == "huber":
+            w = np.where(u <= 1.0, 1.0, 1.0 / np.maximum(u, 1e-300))
+        else:
+            w = np.where(u < 1.0, (1.0 - u * u) ** 2, 0.0)
+        w = w * mask
+        # A series with too few points left keeps its unweighted fit.
+        starved = (w > 0).sum(axis=1) < A.shape[2]
+        w[starved] = mask[starved]
+        new = _weighted_solve(A, y, w)
+        step = np.abs(new - coef).max(axis=1) / np.maximum(np.abs(coef).max(axis=1), 1)
+        coef = new
+        if step.max() < tol:
+            break
+    return {"coef": coef, "scale": scale, "weights": w, "n_iter": it}
+
+
+def _ransac_block(A, y, mask, threshold, idx):
+    m, n_max, q = A.shape
+    rows = np.arange(m)[:, None, None]
+    A_min = A[rows, idx]  # (m, T, q, q)
+    y_min = y[rows, idx]  # (m, T, q)
+
+    det = np.linalg.det(A_min)
+    valid = np.abs(det) > 1e-12 * np.abs(A_min).max(axis=(2, 3)) ** q
+    A_min = np.where(valid[:, :, None, None], A_min, np.eye(q))
+    beta = np.linalg.solve(A_min, y_min[..., None])[..., 0]  # (m, T, q)
+
+    resid = y[:, None, :] - beta[:, :, None, 0] * A[:, None, :, 0]
+    for i in range(1, q):
+        resid -= beta[:, :, None, i] * A[:, None, :, i]
+    inlier = (np.abs(resid) <= threshold[:, None, None]) & mask[:, None, :]
+    count = np.where(valid, inlier.sum(axis=2), -1)
+    sse = np.where(inlier, resid * resid, 0.0).sum(axis=2)
+    # Most inliers first, then lowest SSE among them.
+    best_count = count.max(axis=1, keepdims=True)
+    best = np.argmin(np.where(count == best_count, sse, np.inf), axis=1)
+    return inlier[np.arange(m), best]
+
+
+def ransac_batch(X, y, n=None, n_trials=200, threshold=None, seed=0):
+    """RANSAC with all minimal samples of all series drawn as one index array.
+
+    ``threshold`` is the inlier residual cut-off; by default it is the MAD of
+    each series' y, as in sklearn's RANSACRegressor. The best trial (most
+    inliers, then lowest inlier SSE) is refitted by OLS on its inliers.
+    Returns a dict with ``coef`` (m, p + 1), ``inliers`` and ``n_inliers``.
+    """
+    A, y, mask, n = _batch(X, y, n)
+    m, n_max, q = A.shape
+    if threshold is None:
+        med = np.nanmedian(np.where(mask, y, np.nan), axis=1, keepdims=True)
+        threshold = np.nanmedian(np.where(mask, np.abs(y - med), np.nan), axis=1)
+    threshold = np.broadcast_to(np.asarray(threshold, dtype=np.float64), (m,))
+
+    rng = np.random.default_rng(seed)
+    # Uniform draws scaled by each series' own length (with replacement; a
+    # repeated row only gives a singular trial, which is skipped).
+    idx = (rng.random((m, n_trials, q)) * n[:, None, None]).astype(np.intp)
+
+    # The (series, trial, row) residual tensor is built a block of series at
+    # a time so it stays a few MB.
+    block = max(1, BLOCK_ELEMENTS // (n_trials * n_max))
+    inliers = np.empty((m, n_max), dtype=bool)
+    for s in range(0, m, block):
+        b = slice(s, s + block)
+        inliers[b] = _ransac_block(A[b], y[b], mask[b], threshold[b], idx[b])
+    coef = _weighted_solve(A, y, inliers.astype(np.float64))
+    return {"coef": coef, "inliers": inliers, "n_inliers": inliers.sum(axis=1)}
+
+
+def robust_problems(method="huber", data_dir=PROBLEMS_DIR, **kwargs):
+    """Robust fits of all students/03 problems next to the OLS line.
+
+    ``outliers`` counts rows outside the RANSAC consensus set, or with an
+    IRLS weight below 0.5.
+    """
+    problems = load_problems(data_dir)
+    x, y, n = problems["x"], problems["y"], problems["n"]
+    if method == "ransac":
+        fit = ransac_batch(x, y, n, **kwargs)
+        outliers = n - fit["n_inliers"]
+    else:
+        fit = irls_batch(x, y, n, loss=method, **kwargs)
+        # Padding has weight 0, so only count real rows.
+        real = np.arange(x.shape[1]) < n[:, None]
+        outliers = ((fit["weights"] < 0.5) & real).sum(axis=1)
+    ols = simple_ols_batch(x, y, n)
+    return pd.DataFrame(
+        {
+            "problem": problems["names"],
+            "intercept": fit["coef"][:, 0],
+            "slope": fit["coef"][:, 1],
+            "ols_intercept": ols["intercept"],
+            "ols_slope": ols["slope"],
+            "outliers": outliers,
+        }
+    )
+
+
+def robust_model(name="marketing", method="huber", **kwargs):
+    """Robust fit of a lab model (e.g. marketing, with its Newspaper outliers)."""
+    X, y, features = load_model_data(name)
+    if method == "ransac":
+        fit = ransac_batch(X[None], y[None], **kwargs)
+    else:
+        fit = irls_batch(X[None], y[None], loss=method, **kwargs)
+    return pd.Series(fit["coef"][0], index=["intercept"] + features)
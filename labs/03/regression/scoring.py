@@ -0,0 +1,158 @@
+"""Low-latency scoring for fitted linear models.
+
+``LinearScorer`` keeps the coefficients as a contiguous float64 vector for
+bulk scoring (one matrix-vector product over millions of rows) and as a
+plain tuple of floats for the scalar path, which avoids building a
+one-row DataFrame per call the way ``predict_sales`` in the exercise2 apps
+does. ``serve`` exposes the scorer over a small stdlib HTTP endpoint.
+"""
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from .datasets import MARKETING_CSV, MARKETING_FEATURES
+
+
+class LinearScorer:
+    def __init__(self, coef, intercept, feature_names=None):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64).ravel()
+        self.intercept = float(intercept)
+        self.feature_names = list(
+            feature_names or [f"x{j}" for j in range(len(self.coef))]
+        )
+        self._coef_tuple = tuple(self.coef.tolist())
+
+    @classmethod
+    def from_model(cls, model, feature_names=None):
+        """Build from anything with sklearn-style ``coef_`` / ``intercept_``."""
+        if feature_names is None:
+            feature_names = getattr(model, "feature_names_in_", None)
+            if feature_names is None:
+                feature_names = getattr(model, "feature_names", None)
+        coef = np.ravel(np.asarray(model.coef_, dtype=np.float64))
+        intercept = float(np.ravel(model.intercept_)[0])
+        # Registry artifacts may carry a StandardScaler; fold it into the
+        # coefficients so scoring stays a single dot product.
+        mean = getattr(model, "scaler_mean", None)
+        if mean is not None:
+            coef = coef / model.scaler_scale
+            intercept -= float(coef @ mean)
+        return cls(coef, intercept, feature_names)
+
+    def score_one(self, *values):
+        """Score a single row given as positional feature values."""
+        if len(values) != len(self._coef_tuple):
+            raise TypeError(
+                f"score_one() takes {len(self._coef_tuple)} feature values "
+                f"({', '.join(self.feature_names)}), got {len(values)}"
+            )
+        total = self.intercept
+        for c, v in zip(self._coef_tuple, values):
+            total += c * v
+        return total
+
+    def score(self, X, out=None):
+        """Score an (n x p) array; ``out`` may be a preallocated length-n array."""
+        X = np.asarray(X, dtype=np.float64)
+        out = np.dot(X, self.coef, out=out)
+        out += self.intercept
+        return out
+
+    def score_columns(self, columns):
+        """Score a mapping of feature name -> 1-D array without stacking."""
+        first = np.asarray(columns[self.feature_names[0]], dtype=np.float64)
+        out = np.full(first.shape, self.intercept)
+        for name, c in zip(self.feature_names, self._coef_tuple):
+            out += c * np.asarray(columns[name], dtype=np.float64)
+        return out
+
+
+def marketing_scorer(path=None, registry=None):
+    """Scorer for Sales ~ TV + Radio + Newspaper.
+
+    With ``path=None`` the ``marketing`` model is loaded from ``registry``
+    (the default ``ModelRegistry`` if not given), with its SHA-256 checked
+    against the manifest, and fitted from the CSV only when no version has
+    been saved yet. An explicit ``path`` always fits from that file.
+    """
+    from .streaming import fit_marketing_streaming
+
+    if path is not None:
+        model = fit_marketing_streaming(path)
+    else:
+        from .registry import ModelRegistry
+
+        registry = registry or ModelRegistry()
+        model = registry.load_or_fit(
+            "marketing",
+            lambda: fit_marketing_streaming(MARKETING_CSV),
+            verify=True,
+            feature_names=MARKETING_FEATURES,
+        )
+    return LinearScorer.from_model(model, MARKETING_FEATURES)
+
+
+def _make_handler(scorer):
+    class ScoringHandler(BaseHTTPRequestHandler):
+        """``GET /score?TV=..&Radio=..`` for one row, ``POST /score`` for many.
+
+        The POST body is JSON, either ``{"rows": [[...], ...]}`` or
+        ``{"TV": [...], "Radio": [...], ...}``.
+        """
+
+        def _reply(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/score":
+                return self._reply(404, {"error": "not found"})
+            query = parse_qs(url.query)
+            try:
+                values = [float(query[name][0]) for name in scorer.feature_names]
+            except (KeyError, ValueError) as exc:
+                return self._reply(400, {"error": f"bad query: {exc}"})
+            self._reply(200, {"prediction": scorer.score_one(*values)})
+
+        def do_POST(self):
+            if urlparse(self.path).path != "/score":
+                return self._reply(404, {"error": "not found"})
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+                if "rows" in payload:
+                    predictions = scorer.score(payload["rows"])
+                else:
+                    predictions = scorer.score_columns(payload)
+            except (KeyError, ValueError, TypeError) as exc:
+                return self._reply(400, {"error": f"bad request: {exc}"})
+            self._reply(200, {"predictions": np.atleast_1d(predictions).tolist()})
+
+        def log_message(self, format, *args):
+            pass
+
+    return ScoringHandler
+
+
+def make_server(scorer, host="127.0.0.1", port=8000):
+    return ThreadingHTTPServer((host, port), _make_handler(scorer))
+
+
+def serve(scorer=None, host="127.0.0.1", port=8000):
+    scorer = scorer or marketing_scorer()
+    server = make_server(scorer, host, port)
+    print(f"Scoring {scorer.feature_names} on http://{host}:{server.server_port}/score")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
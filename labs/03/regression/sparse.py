@@ -0,0 +1,229 @@
+"""Sparse categorical design matrices built straight from category codes.
+
+A one-hot block has exactly one nonzero per row, so its CSR arrays are the
+codes themselves: ``indices = code``, ``indptr = arange(n + 1)``, ``data =
+1``. No dense n x k intermediate (as ``OneHotEncoder(sparse_output=False)``
+plus ``pd.concat`` produces) is ever allocated. High-cardinality columns can
+use the hashing trick instead, mapping each distinct value to one of
+``n_buckets`` columns with a ±1 sign.
+
+The resulting CSR matrices go straight into ``OLSFit.fit`` and
+``sparse_lsqr`` here, and into sklearn classifiers that accept sparse input.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.linalg import LinearOperator, lsqr
+
+from .datasets import SALARIES_CSV, SALARIES_FEATURES, SALARIES_TARGET
+
+SALARIES_CATEGORICAL = ["rank", "discipline", "sex"]
+
+INTRUSION_NUMERIC = [
+    "network_packet_size",
+    "login_attempts",
+    "session_duration",
+    "ip_reputation_score",
+    "failed_logins",
+    "unusual_time_access",
+]
+INTRUSION_CATEGORICAL = ["protocol_type", "browser_type"]
+INTRUSION_TARGET = "attack_detected"
+
+
+def one_hot_csr(codes, n_categories, drop_first=False):
+    """CSR one-hot block for integer ``codes``; negative codes give empty rows."""
+    codes = np.asarray(codes, dtype=np.int64)
+    keep = codes >= (1 if drop_first else 0)
+    indices = codes[keep] - (1 if drop_first else 0)
+    indptr = np.r_[0, np.cumsum(keep)]
+    width = n_categories - (1 if drop_first else 0)
+    return sparse.csr_matrix(
+        (np.ones(len(indices)), indices, indptr), shape=(len(codes), width)
+    )
+
+
+def hashed_csr(values, n_buckets=2**18, signed=True, salt=""):
+    """Hashing-trick block: each distinct value goes to ``hash % n_buckets``.
+
+    Only the distinct values are hashed (after ``pd.factorize``), so the cost
+    per row is one gather. ``signed`` uses another hash bit as a ±1 sign so
+    collisions cancel in expectation. Missing values give empty rows.
+    """
+    codes, uniques = pd.factorize(pd.Series(values))
+    keys = pd.Index(uniques.astype(str)).map(lambda v: f"{salt}={v}")
+    h = pd.util.hash_array(np.asarray(keys, dtype=object))
+    bucket = (h % np.uint64(n_buckets)).astype(np.int64)
+    sign = np.where((h >> np.uint64(63)) & np.uint64(1), -1.0, 1.0)
+    keep = codes >= 0
+    indptr = np.r_[0, np.cumsum(keep)]
+    data = sign[codes[keep]] if signed else np.ones(int(keep.sum()))
+    return sparse.csr_matrix(
+        (data, bucket[codes[keep]], indptr), shape=(len(codes), n_buckets)
+    )
+
+
+class CategoricalEncoder:
+    """Numeric columns plus one-hot / hashed categoricals as one CSR matrix.
+
+    Categories are learned in ``fit``; unseen values in ``transform`` give
+    all-zero rows (sklearn's ``handle_unknown='ignore'``). ``drop_first``
+    drops each one-hot block's first level so the design stays full rank
+    next to an intercept.
+    """
+
+    def __init__(
+        self,
+        numeric=(),
+        categorical=(),
+        hashed=(),
+        n_buckets=2**18,
+        drop_first=True,
+    ):
+        self.numeric = list(numeric)
+        self.categorical = list(categorical)
+        self.hashed = list(hashed)
+        self.n_buckets = n_buckets
+        self.drop_first = drop_first
+        self.categories_ = {}
+
+    def fit(self, frame):
+        for col in self.categorical:
+            _, uniques = pd.factorize(frame[col], sort=True)
+            self.categories_[col] = pd.Index(uniques)
+        return self
+
+    def transform(self, frame):
+        blocks = []
+        if self.numeric:
+            values = frame[self.numeric].to_numpy(dtype=np.float64)
+            blocks.append(sparse.csr_matrix(values))
+        for col in self.categorical:
+            codes = self.categories_[col].get_indexer(frame[col])
+            blocks.append(
+                one_hot_csr(codes, len(self.categories_[col]), self.drop_first)
+            )
+        for col in self.hashed:
+            blocks.append(hashed_csr(frame[col], self.n_buckets, salt=col))
+        return sparse.hstack(blocks, format="csr")
+
+    def fit_transform(self, frame):
+        return self.fit(frame).transform(frame)
+
+    @property
+    def feature_names_(self):
+        names = list(self.numeric)
+        for col in self.categorical:
+            levels = self.categories_[col][1 if self.drop_first else 0 :]
+            names += [f"{col}_{level}" for level in levels]
+        for col in self.hashed:
+            names += [f"{col}#{k}" for k in range(self.n_buckets)]
+        return names
+
+
+def sparse_lsqr(X, y, alpha=0.0, tol=1e-10, max_iter=None):
+    """Intercept + coefficients of (ridge) least squares on a wide sparse X.
+
+    For hashed designs with too many columns for a dense Gram matrix. The
+    column centring is applied inside a ``LinearOperator``, so X stays
+    sparse; ``alpha`` is the ridge penalty on the slopes. Returns
+    ``(coef, intercept, n_iter)``.
+    """
+    X = sparse.csr_matrix(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n, p = X.shape
+    m = np.asarray(X.sum(axis=0)).ravel() / n
+    Xt = X.T.tocsr()
+    op = LinearOperator(
+        (n, p),
+        matvec=lambda v: X @ v - m @ v,
+        rmatvec=lambda u: Xt @ u - m * u.sum(),
+        dtype=np.float64,
+    )
+    y_mean = y.mean()
+    result = lsqr(
+        op, y - y_mean, damp=np.sqrt(alpha), atol=tol, btol=tol, iter_lim=max_iter
+    )
+    coef = result[0]
+    return coef, y_mean - m @ coef, result[2]
+
+
+def salaries_design(path=SALARIES_CSV, categorical=SALARIES_CATEGORICAL):
+    """CSR design of phd, service and one-hot rank/discipline/sex."""
+    data = pd.read_csv(path)
+    encoder = CategoricalEncoder(SALARIES_FEATURES, categorical)
+    X = encoder.fit_transform(data)
+    return X, data[SALARIES_TARGET].to_numpy(dtype=np.float64), encoder
+
+
+def sparse_salaries(path=SALARIES_CSV, categorical=SALARIES_CATEGORICAL):
+    """Return (coefficient table, ``OLSFit``) of salary ~ phd + service + dummies."""
+    from .ols import OLSFit
+
+    X, y, encoder = salaries_design(path, categorical)
+    fit = OLSFit.fit(X, y)
+    table = pd.DataFrame(
+        {
+            "term": ["intercept"] + encoder.feature_names_,
+            "coef": np.r_[fit.intercept_, fit.coef_],
+        }
+    )
+    return table, fit
+
+
+def intrusion_design(path, hashed=(), n_buckets=2**10):
+    """CSR design and labels for cybersecurity_intrusion_data.csv.
+
+    Mirrors the IntrusionDetectionSystem notebook (session_id and
+    encryption_used dropped, protocol_type and browser_type one-hot), with
+    the one-hot blocks built sparse. Columns listed in ``hashed`` use the
+    hashing trick instead.
+    """
+    data = pd.read_csv(path)
+    categorical = [c for c in INTRUSION_CATEGORICAL if c not in hashed]
+    encoder = CategoricalEncoder(
+        INTRUSION_NUMERIC, categorical, hashed, n_buckets, drop_first=False
+    )
+    X = encoder.fit_transform(data)
+    return X, data[INTRUSION_TARGET].to_numpy(), encoder
+
+
+def fit_classifiers(X, y, models=None, test_size=0.25, seed=42):
+    """Accuracy / precision / recall of sklearn classifiers on a CSR design.
+
+    Same split and metrics as the IntrusionDetectionSystem notebook, but
+    scaled with ``MaxAbsScaler`` so X stays sparse (centring would densify
+    it). The default models all accept sparse input; GaussianNB does not and
+    is left out.
+    """
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import accuracy_score, precision_score, recall_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import MaxAbsScaler
+    from sklearn.tree import DecisionTreeClassifier
+
+    if models is None:
+        models = {
+            "Random Forest Classifier": RandomForestClassifier(random_state=seed),
+            "Decision Tree Classifier": DecisionTreeClassifier(random_state=seed),
+            "Logistic Regression": LogisticRegression(max_iter=1000),
+        }
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=seed
+    )
+    scaler = MaxAbsScaler().fit(X_train)
+    X_train, X_test = scaler.transform(X_train), scaler.transform(X_test)
+    rows = []
+    for name, model in models.items():
+        y_pred = model.fit(X_train, y_train).predict(X_test)
+        rows.append(
+            {
+                "model": name,
+                "accuracy": accuracy_score(y_test, y_pred),
+                "precision": precision_score(y_test, y_pred),
+                "recall": recall_score(y_test, y_pred),
+            }
+        )
+    return pd.DataFrame(rows)
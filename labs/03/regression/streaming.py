@@ -0,0 +1,153 @@
+"""Out-of-core OLS from accumulated sufficient statistics.
+
+The table is read in chunks and only the (p+1) x (p+1) co-moment matrix of
+``[X, y]`` is kept, so memory does not depend on the number of rows. Chunks
+are merged with the pairwise (Chan et al.) update on centred statistics,
+which stays accurate for hundreds of millions of rows where accumulating raw
+``sum(x * x)`` would lose digits to cancellation.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .datasets import MARKETING_CSV, MARKETING_FEATURES, MARKETING_TARGET
+
+
+class GramAccumulator:
+    """Running n, column means and centred co-moment matrix of ``[X, y]``."""
+
+    def __init__(self, n_features):
+        self.n_features = n_features
+        self.n = 0
+        self.mean = np.zeros(n_features + 1)
+        self.comoment = np.zeros((n_features + 1, n_features + 1))
+
+    def update(self, X, y):
+        Z = np.column_stack([np.asarray(X, dtype=np.float64), y])
+        if Z.shape[1] != self.n_features + 1:
+            raise ValueError(
+                f"expected {self.n_features} features, got {Z.shape[1] - 1}"
+            )
+        n_b = Z.shape[0]
+        if n_b == 0:
+            return self
+        mean_b = Z.mean(axis=0)
+        D = Z - mean_b
+        self._merge(n_b, mean_b, D.T @ D)
+        return self
+
+    def merge(self, other):
+        """Fold another accumulator (e.g. from a worker process) into this one."""
+        if other.n:
+            self._merge(other.n, other.mean, other.comoment)
+        return self
+
+    def _merge(self, n_b, mean_b, comoment_b):
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean = self.mean + delta * (n_b / n)
+        self.comoment = (
+            self.comoment + comoment_b + np.outer(delta, delta) * (n_a * n_b / n)
+        )
+        self.n = n
+
+    @property
+    def xtx(self):
+        """Raw Gram matrix of ``[1, X]`` (intercept column first)."""
+        p = self.n_features
+        G = np.empty((p + 1, p + 1))
+        mx = self.mean[:p]
+        G[0, 0] = self.n
+        G[0, 1:] = G[1:, 0] = self.n * mx
+        G[1:, 1:] = self.comoment[:p, :p] + self.n * np.outer(mx, mx)
+        return G
+
+    @property
+    def xty(self):
+        """Raw ``[1, X]^T y`` (intercept entry first)."""
+        p = self.n_features
+        my = self.mean[p]
+        return np.concatenate(
+            [[self.n * my], self.comoment[:p, p] + self.n * self.mean[:p] * my]
+        )
+
+    @property
+    def yty(self):
+        my = self.mean[self.n_features]
+        return self.comoment[-1, -1] + self.n * my * my
+
+    def solve(self):
+        """Return (coef, intercept, sse) of the least-squares fit."""
+        p = self.n_features
+        Sxx = self.comoment[:p, :p]
+        sxy = self.comoment[:p, p]
+        try:
+            coef = np.linalg.solve(Sxx, sxy)
+        except np.linalg.LinAlgError:
+            coef = np.linalg.lstsq(Sxx, sxy, rcond=None)[0]
+        intercept = self.mean[p] - self.mean[:p] @ coef
+        sse = max(self.comoment[p, p] - coef @ sxy, 0.0)
+        return coef, intercept, sse
+
+
+class StreamingLinearRegression:
+    """LinearRegression-like model fitted chunk by chunk.
+
+    Exposes ``coef_`` and ``intercept_`` like sklearn's LinearRegression, plus
+    ``r2_`` and ``rmse_`` of the in-sample fit.
+    """
+
+    def __init__(self, feature_names=None):
+        self.feature_names = feature_names
+        self.stats = None
+
+    def partial_fit(self, X, y):
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[:, None]
+        if self.stats is None:
+            self.stats = GramAccumulator(X.shape[1])
+        self.stats.update(X, np.asarray(y, dtype=np.float64))
+        self._solve()
+        return self
+
+    def fit_csv(
+        self,
+        path=MARKETING_CSV,
+        features=None,
+        target=MARKETING_TARGET,
+        chunksize=1_000_000,
+    ):
+        """Stream ``path`` in chunks of ``chunksize`` rows and fit on it."""
+        features = list(features or self.feature_names or MARKETING_FEATURES)
+        self.feature_names = features
+        self.stats = GramAccumulator(len(features))
+        reader = pd.read_csv(
+            path,
+            usecols=features + [target],
+            dtype=np.float64,
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            self.stats.update(chunk[features].to_numpy(), chunk[target].to_numpy())
+        self._solve()
+        return self
+
+    def _solve(self):
+        coef, intercept, sse = self.stats.solve()
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.n_samples_ = self.stats.n
+        self.r2_ = 1.0 - sse / self.stats.comoment[-1, -1]
+        self.rmse_ = np.sqrt(sse / self.stats.n)
+
+    def predict(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+
+def fit_marketing_streaming(path=MARKETING_CSV, chunksize=1_000_000):
+    """Fit Sales ~ TV + Radio + Newspaper without loading the whole file."""
+    return StreamingLinearRegression(MARKETING_FEATURES).fit_csv(
+        path, MARKETING_FEATURES, MARKETING_TARGET, chunksize=chunksize
+    )
@@ -0,0 +1,129 @@
+"""Best-subset search over all 2^k feature subsets from one Gram matrix.
+
+The centred, standardised ``X^T X``, ``X^T y`` and ``y^T y`` are computed
+once. A subset's residual sum of squares is then
+``syy - c_S^T G_SS^{-1} c_S``, so evaluating a subset only slices the
+precomputed matrices and solves an |S| x |S| system. Subsets of the same
+size are gathered into blocks and solved with one batched call.
+"""
+
+from itertools import combinations, islice
+
+import numpy as np
+import pandas as pd
+
+from .datasets import load_model_data
+from .design import as_2d, information_criteria
+
+CRITERIA = ("adj_r2", "aic", "bic")
+
+# Upper bound on the number of float64 entries in one gathered block of
+# sub-Gram matrices (~16 MB).
+BLOCK_ELEMENTS = 2_000_000
+
+
+def _solve_block(G, c):
+    try:
+        return np.linalg.solve(G, c[:, :, None])[:, :, 0]
+    except np.linalg.LinAlgError:
+        # Some subset in the block is exactly collinear.
+        return (np.linalg.pinv(G) @ c[:, :, None])[:, :, 0]
+
+
+def _subset_rss(G, c, syy, size):
+    """Yield (index matrix, rss) blocks for every subset of ``size`` features."""
+    k = len(c)
+    if size == 0:
+        yield np.empty((1, 0), dtype=np.intp), np.array([syy])
+        return
+    block = max(1, BLOCK_ELEMENTS // (size * size))
+    combos = combinations(range(k), size)
+    while True:
+        chunk = list(islice(combos, block))
+        if not chunk:
+            return
+        idx = np.array(chunk, dtype=np.intp)
+        G_sub = G[idx[:, :, None], idx[:, None, :]]
+        c_sub = c[idx]
+        beta = _solve_block(G_sub, c_sub)
+        rss = syy - np.einsum("ij,ij->i", c_sub, beta)
+        yield idx, np.maximum(rss, 0.0)
+
+
+def _criteria(rss, n_features, n, syy):
+    k_params = n_features + 1
+    aic, bic = information_criteria(rss, n, k_params)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        adj_r2 = 1 - (rss / (n - k_params)) / (syy / (n - 1))
+    return {
+        "rss": rss,
+        "r2": 1 - rss / syy,
+        "adj_r2": adj_r2,
+        "aic": aic,
+        "bic": bic,
+    }
+
+
+def _best_rows(crit, top):
+    """Indices of rows within the best ``top`` of at least one criterion."""
+    n_rows = len(crit[CRITERIA[0]])
+    if top is None or n_rows <= top:
+        return np.arange(n_rows)
+    keep = []
+    for name in CRITERIA:
+        score = -crit[name] if name == "adj_r2" else crit[name]
+        keep.append(np.argpartition(score, top - 1)[:top])
+    return np.unique(np.concatenate(keep))
+
+
+def best_subsets(X, y, feature_names=None, max_size=None, top=50, rank_by="bic"):
+    """Evaluate every feature subset and rank them.
+
+    Returns a DataFrame with the subset, its size, RSS, R², adjusted R², AIC
+    and BIC (statsmodels' Gaussian log-likelihood definitions), sorted by
+    ``rank_by``. With ``top`` set, only subsets in the best ``top`` of at
+    least one criterion are kept, which bounds memory for large k.
+    """
+    if rank_by not in CRITERIA:
+        raise ValueError(f"rank_by must be one of {CRITERIA}")
+    X = as_2d(X)
+    y = np.asarray(y, dtype=np.float64)
+    n, k = X.shape
+    names = list(feature_names or [f"x{j}" for j in range(k)])
+    max_size = k if max_size is None else min(max_size, k)
+
+    Xc = X - X.mean(axis=0)
+    yc = y - y.mean()
+    scale = np.sqrt((Xc * Xc).sum(axis=0))
+    scale[scale == 0] = 1.0
+    Xs = Xc / scale
+    G = Xs.T @ Xs
+    c = Xs.T @ yc
+    syy = yc @ yc
+
+    parts = []
+    for size in range(max_size + 1):
+        for idx, rss in _subset_rss(G, c, syy, size):
+            crit = _criteria(rss, size, n, syy)
+            rows = _best_rows(crit, top)
+            part = pd.DataFrame({name: values[rows] for name, values in crit.items()})
+            part.insert(0, "n_features", size)
+            part.insert(
+                0, "features", ["+".join(names[j] for j in idx[i]) for i in rows]
+            )
+            parts.append(part)
+        if top is not None and len(parts) > 1:
+            table = pd.concat(parts, ignore_index=True)
+            rows = _best_rows({name: table[name].to_numpy() for name in CRITERIA}, top)
+            parts = [table.iloc[rows]]
+
+    table = pd.concat(parts, ignore_index=True)
+    table.loc[table.n_features == 0, "features"] = "(intercept only)"
+    table = table.sort_values(rank_by, ascending=rank_by != "adj_r2")
+    return table.reset_index(drop=True)
+
+
+def subsets_model(name="marketing", top=None, rank_by="bic"):
+    """All-subsets table for one of the lab 03 models (``marketing`` or ``co2``)."""
+    X, y, features = load_model_data(name)
+    return best_subsets(X, y, features, top=top, rank_by=rank_by)
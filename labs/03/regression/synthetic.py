@@ -0,0 +1,121 @@
+"""Synthetic datasets with the marketing and single-feature problem schemas.
+
+Rows are generated chunk by chunk from a seeded generator and written
+straight to disk, so files of 1e9 rows never need to fit in memory. Noise
+level and the collinearity between the spend columns are controlled.
+
+Two on-disk formats are supported: ``csv`` (same layout as
+labs/03/marketing.csv) and ``npy``, a float64 (n x columns) array written
+through ``np.lib.format.open_memmap`` that can be memory-mapped back.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+from .datasets import MARKETING_FEATURES, MARKETING_TARGET
+
+# Coefficients of Sales ~ TV + Radio + Newspaper fitted on marketing.csv,
+# and the spend ranges of that file.
+MARKETING_COEF = np.array([0.05445, 0.10700, 0.00034])
+MARKETING_INTERCEPT = 4.625
+MARKETING_RANGES = np.array([[0.0, 300.0], [0.0, 50.0], [0.0, 115.0]])
+MARKETING_NOISE = 1.645
+
+CHUNK_ROWS = 1_000_000
+
+
+def marketing_chunk(rng, n, noise=MARKETING_NOISE, collinearity=0.0):
+    """(X, y) for ``n`` rows; ``collinearity`` is the correlation of Radio and
+    Newspaper with TV on the latent normal scale (0 = independent)."""
+    z = rng.standard_normal((n, 3))
+    rho = collinearity
+    z[:, 1:] = rho * z[:, :1] + np.sqrt(1.0 - rho * rho) * z[:, 1:]
+    lo, hi = MARKETING_RANGES.T
+    X = lo + (hi - lo) * ndtr(z)  # uniform marginals over the spend ranges
+    y = MARKETING_INTERCEPT + X @ MARKETING_COEF + noise * rng.standard_normal(n)
+    return X, y
+
+
+def problem_chunk(rng, n, slope=1.0, intercept=0.0, x_range=(0.0, 100.0), noise=1.0):
+    x = rng.uniform(x_range[0], x_range[1], n)
+    return x[:, None], intercept + slope * x + noise * rng.standard_normal(n)
+
+
+def _write(path, columns, n_rows, make_chunk, chunk_rows, fmt):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "npy":
+        out = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.float64, shape=(n_rows, len(columns))
+        )
+    elif fmt != "csv":
+        raise ValueError("fmt must be 'csv' or 'npy'")
+
+    for start in range(0, n_rows, chunk_rows):
+        size = min(chunk_rows, n_rows - start)
+        X, y = make_chunk(size)
+        if fmt == "npy":
+            out[start : start + size, :-1] = X
+            out[start : start + size, -1] = y
+        else:
+            frame = pd.DataFrame(np.column_stack([X, y]), columns=columns)
+            frame.to_csv(
+                path,
+                mode="w" if start == 0 else "a",
+                header=start == 0,
+                index=False,
+                float_format="%.6g",
+            )
+    if fmt == "npy":
+        out.flush()
+        del out
+    return path
+
+
+def generate_marketing(
+    path,
+    n_rows,
+    noise=MARKETING_NOISE,
+    collinearity=0.0,
+    seed=0,
+    chunk_rows=CHUNK_ROWS,
+    fmt="csv",
+):
+    """Write ``n_rows`` of TV, Radio, Newspaper, Sales to ``path``."""
+    rng = np.random.default_rng(seed)
+    return _write(
+        path,
+        MARKETING_FEATURES + [MARKETING_TARGET],
+        n_rows,
+        lambda n: marketing_chunk(rng, n, noise, collinearity),
+        chunk_rows,
+        fmt,
+    )
+
+
+def generate_problem(
+    path,
+    n_rows,
+    feature="x",
+    target="y",
+    slope=1.0,
+    intercept=0.0,
+    x_range=(0.0, 100.0),
+    noise=1.0,
+    seed=0,
+    chunk_rows=CHUNK_ROWS,
+    fmt="csv",
+):
+    """Write a two-column single-feature problem like students/03/data."""
+    rng = np.random.default_rng(seed)
+    return _write(
+        path,
+        [feature, target],
+        n_rows,
+        lambda n: problem_chunk(rng, n, slope, intercept, x_range, noise),
+        chunk_rows,
+        fmt,
+    )
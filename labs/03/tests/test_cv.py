@@ -0,0 +1,11 @@
+import pandas as pd
+
+from regression.cv import repeated_kfold
+from regression.datasets import load_model_data
+
+
+def test_scores_do_not_depend_on_n_jobs():
+    X, y, _ = load_model_data("marketing")
+    serial = repeated_kfold(X, y, n_repeats=20, seed=3, n_jobs=1)
+    parallel = repeated_kfold(X, y, n_repeats=20, seed=3, n_jobs=2)
+    pd.testing.assert_frame_equal(serial, parallel)
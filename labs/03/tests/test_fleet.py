@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from regression.fleet import check_leaderboard, parse_metrics, rank
+
+
+def test_digits_in_the_label_are_not_the_value():
+    assert parse_metrics("R2 score for 3 features: 0.9")["r2"] == 0.9
+
+
+def test_r2_orders_runs_with_similar_runtimes():
+    table = pd.DataFrame(
+        {
+            "name": ["a", "b", "c"],
+            "status": ["ok"] * 3,
+            "wall_s": [1.00, 1.02, 3.0],
+            "r2": [0.5, 0.9, 0.99],
+        }
+    )
+    assert rank(table).name.tolist() == ["b", "a", "c"]
+
+
+def test_missing_and_new_submissions_fail_the_gate():
+    baseline = pd.DataFrame(
+        {"name": ["a", "b"], "status": ["ok"] * 2, "wall_s": [1.0] * 2, "r2": 0.9}
+    )
+    table = pd.DataFrame(
+        {"name": ["a", "c"], "status": ["ok"] * 2, "wall_s": [1.0] * 2, "r2": 0.9}
+    )
+    problems = check_leaderboard(table, baseline)
+
+    assert dict(zip(problems.name, problems.reason)) == {"b": "missing", "c": "new"}
+    assert np.isnan(problems.set_index("name").wall_s["b"])
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from regression.grouped import grouped_ols
+
+
+def test_missing_group_label_is_its_own_group():
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 10, 60)
+    groups = pd.DataFrame(
+        {"a": ["p"] * 40 + ["q"] * 20, "b": ["u"] * 20 + ["v"] * 20 + [np.nan] * 20}
+    )
+    slopes = np.repeat([1.0, 2.0, 3.0], 20)
+    y = slopes * x + rng.normal(0, 0.01, 60)
+
+    table = grouped_ols(x, y, groups)
+
+    assert len(table) == 3
+    assert table.n.tolist() == [20, 20, 20]
+    assert table.b.isna().sum() == 1
+    # (q, NaN) used to share a code with (p, v) and merge into it.
+    nan_row = table[table.b.isna()].iloc[0]
+    np.testing.assert_allclose(nan_row.x0, 3.0, atol=1e-2)
+    np.testing.assert_allclose(sorted(table.x0), [1.0, 2.0, 3.0], atol=1e-2)
+
+
+def test_mixed_feature_scales_are_not_singular():
+    rng = np.random.default_rng(1)
+    X = np.column_stack([rng.normal(0, 1e4, 50), rng.normal(0, 1, 50)])
+    y = 3e-4 * X[:, 0] + 2.0 * X[:, 1] + 1.0 + rng.normal(0, 0.01, 50)
+
+    table = grouped_ols(X, y, np.zeros(50))
+
+    np.testing.assert_allclose(table[["x0", "x1"]].iloc[0], [3e-4, 2.0], rtol=1e-2)
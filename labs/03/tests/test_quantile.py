@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from regression.datasets import load_model_data
+from regression.quantile import ConvergenceWarning, quantile_regression
+
+
+def test_unsorted_levels_keep_their_labels():
+    X, y, _ = load_model_data("marketing")
+    shuffled = quantile_regression(X, y, (0.9, 0.1, 0.5))
+    ordered = quantile_regression(X, y, (0.1, 0.5, 0.9))
+
+    np.testing.assert_array_equal(shuffled.quantiles, [0.1, 0.5, 0.9])
+    np.testing.assert_allclose(shuffled.coef_, ordered.coef_)
+    band = shuffled.predict(X)
+    np.testing.assert_allclose(band, ordered.predict(X))
+    coverage = (y[:, None] <= band).mean(axis=0)
+    np.testing.assert_allclose(coverage, shuffled.quantiles, atol=0.02)
+
+
+def test_irls_reports_levels_that_hit_max_iter():
+    X, y, _ = load_model_data("marketing")
+    with pytest.warns(ConvergenceWarning, match="0.9"):
+        fit = quantile_regression(X, y, (0.5, 0.9), method="irls")
+
+    assert fit.converged.tolist() == [True, False]
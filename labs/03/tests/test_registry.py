@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from regression.registry import ModelRegistry
+from regression.scoring import marketing_scorer
+
+
+class _Model:
+    coef_ = np.array([1.0, 2.0])
+    intercept_ = 0.5
+
+
+def test_list_orders_versions_numerically(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    for _ in range(11):
+        registry.save("m", _Model())
+
+    assert registry.list().version.tolist() == list(range(1, 12))
+
+
+def test_marketing_scorer_loads_registered_model(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    first = marketing_scorer(registry=registry)
+    second = marketing_scorer(registry=registry)
+
+    assert registry.list().version.tolist() == [1]
+    np.testing.assert_array_equal(first.coef, second.coef)
+
+
+def test_marketing_scorer_rejects_a_tampered_artifact(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    marketing_scorer(registry=registry)
+    path = tmp_path / "marketing" / "v1.npy"
+    values = np.load(path)
+    values[1] += 1.0
+    np.save(path, values)
+
+    with pytest.raises(ValueError, match="manifest hash"):
+        marketing_scorer(registry=ModelRegistry(tmp_path))
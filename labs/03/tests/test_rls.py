@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from regression.datasets import load_model_data
+from regression.ols import OLSFit
+from regression.rls import RecursiveLeastSquares
+
+
+def test_streamed_fit_matches_ols():
+    X, y, _ = load_model_data("marketing")
+    model = RecursiveLeastSquares(refresh_every=50).partial_fit(X, y)
+    ols = OLSFit.fit(X, y)
+
+    assert model.coef_.shape == (3,)
+    np.testing.assert_allclose(model.predict(X), ols.predict(X), rtol=1e-6)
+
+
+def test_rank_deficient_stream_raises_value_error():
+    X, y, _ = load_model_data("marketing")
+    X = np.column_stack([X[:, 0], np.full(len(X), 5.0)])
+    model = RecursiveLeastSquares(lam=0.9, refresh_every=50)
+
+    with pytest.raises(ValueError, match="rank deficient"):
+        model.partial_fit(X, y)
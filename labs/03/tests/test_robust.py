@@ -0,0 +1,25 @@
+import numpy as np
+
+from regression.batch import simple_ols_batch
+from regression.datasets import load_problems
+from regression.robust import irls_batch
+
+
+def test_unit_weights_reproduce_ols():
+    problems = load_problems()
+    x, y, n = problems["x"], problems["y"], problems["n"]
+    # A huge Huber threshold keeps every weight at one.
+    fit = irls_batch(x, y, n, loss="huber", c=1e12)
+    ols = simple_ols_batch(x, y, n)
+
+    np.testing.assert_allclose(fit["coef"][:, 0], ols["intercept"], rtol=1e-9)
+    np.testing.assert_allclose(fit["coef"][:, 1], ols["slope"], rtol=1e-9)
+
+
+def test_large_offset_does_not_shift_intercept():
+    rng = np.random.default_rng(0)
+    x = rng.uniform(1e5, 2e5, 200)
+    y = 2.0 + 0.5 * x + rng.normal(0, 1, 200)
+    fit = irls_batch(x[None], y[None], loss="huber", c=1e12)
+
+    np.testing.assert_allclose(fit["coef"][0], np.polyfit(x, y, 1)[::-1], rtol=1e-9)
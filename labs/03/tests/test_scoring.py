@@ -0,0 +1,13 @@
+import pytest
+
+from regression.scoring import LinearScorer
+
+
+def test_score_one_rejects_wrong_number_of_values():
+    scorer = LinearScorer([1.0, 2.0, 3.0], 0.5)
+
+    assert scorer.score_one(1, 1, 1) == 6.5
+    with pytest.raises(TypeError):
+        scorer.score_one(1, 1)
+    with pytest.raises(TypeError):
+        scorer.score_one(1, 1, 1, 1)